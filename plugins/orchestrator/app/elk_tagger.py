@@ -9,21 +9,57 @@ import asyncio
 import logging
 import re
 import base64
+import threading
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 try:
     from elasticsearch import AsyncElasticsearch
     from elasticsearch.exceptions import ConnectionError, TransportError
+    from elasticsearch.helpers import async_streaming_bulk
 except ImportError:
     AsyncElasticsearch = None
+    async_streaming_bulk = None
     ConnectionError = Exception
     TransportError = Exception
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from plugins.orchestrator.app.config import OrchestratorConfig
 
 
+# Validation patterns (compiled once, used on every tag)
+_OP_ID_RE = re.compile(r'[a-zA-Z0-9\-]{8,64}')
+_TECHNIQUE_RE = re.compile(r'T\d{4}(\.\d{3})?')
+_TACTIC_RE = re.compile(r'[a-zA-Z0-9\s]+')
+_OP_NAME_STRIP_RE = re.compile(r'[^\w\s-]')
+_CLIENT_ID_STRIP_RE = re.compile(r'[^\w-]')
+# Already-clean shapes (a field matching these is left untouched by sanitization)
+_OP_NAME_CLEAN_RE = re.compile(r'[\w\s-]{0,200}')
+_CLIENT_ID_CLEAN_RE = re.compile(r'[\w-]{0,100}')
+_MAX_OP_ID_LEN = 64
+
+# Metadata list caps (keeps ELK documents bounded for very long chains)
+_MAX_TECHNIQUES = 500
+_MAX_ABILITY_NAMES = 100
+
+# Bulk tagging limits (per _bulk request)
+_BULK_CHUNK_SIZE = 500
+_BULK_MAX_CHUNK_BYTES = 5 * 1024 * 1024
+
+
+def _fallback_bytes(metadata: Dict[str, Any]) -> bytes:
+    """Serialize a fallback record to newline-terminated JSON bytes (orjson when installed)."""
+    if orjson:
+        return orjson.dumps(metadata, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(metadata) + '\n').encode()
+
+
 class ELKTagger:
     """
     Tags Caldera operations in Elasticsearch for SIEM filtering.
@@ -35,6 +71,9 @@ class ELKTagger:
     - Retry logic with exponential backoff
     """
     
+    # Fallback write queue (tag callers enqueue, a single writer drains to disk)
+    FALLBACK_QUEUE_SIZE = 1000
+    
     def __init__(self, logger: logging.Logger):
         """
         Initialize ELK tagger with configuration.
@@ -55,6 +94,13 @@ class ELKTagger:
         
         # Semaphore to limit concurrent tags
         self._tag_semaphore = asyncio.Semaphore(5)
+        
+        # Append-only fallback log (one NDJSON file per UTC day, opened lazily)
+        self._fallback_fp = None
+        self._fallback_path = None
+        self._fallback_lock = threading.Lock()
+        self._fallback_queue = asyncio.Queue(maxsize=self.FALLBACK_QUEUE_SIZE)
+        self._fallback_writer = None
     
     def _init_elk_client(self) -> Optional[AsyncElasticsearch]:
         """
@@ -94,9 +140,9 @@ class ELKTagger:
         Returns:
             True if valid format
         """
-        # Allow UUID format or alphanumeric with hyphens
-        pattern = r'^[a-zA-Z0-9\-]{8,64}$'
-        return bool(re.match(pattern, str(operation_id)))
+        # Allow UUID format or alphanumeric with hyphens (length check first skips huge inputs)
+        operation_id = str(operation_id)
+        return len(operation_id) <= _MAX_OP_ID_LEN and bool(_OP_ID_RE.fullmatch(operation_id))
     
     def _sanitize_metadata(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -108,27 +154,39 @@ class ELKTagger:
         Returns:
             Sanitized metadata
         """
+        # Each field is only rewritten when it fails its clean check (the common
+        # case for real operations), so clean metadata passes through as-is
+        
         # Sanitize operation name (remove special chars, limit length)
         if 'operation_name' in metadata:
-            metadata['operation_name'] = re.sub(r'[^\w\s-]', '', metadata['operation_name'])[:200]
+            name = metadata['operation_name']
+            if not _OP_NAME_CLEAN_RE.fullmatch(name):
+                metadata['operation_name'] = _OP_NAME_STRIP_RE.sub('', name)[:200]
         
         # Validate technique IDs (MITRE ATT&CK format: T1234 or T1234.001)
         if 'techniques' in metadata:
-            metadata['techniques'] = [
-                tid for tid in metadata['techniques']
-                if re.match(r'^T\d{4}(\.\d{3})?$', str(tid))
-            ]
+            techniques = metadata['techniques']
+            if not all(_TECHNIQUE_RE.fullmatch(str(tid)) for tid in techniques):
+                metadata['techniques'] = [
+                    tid for tid in techniques
+                    if _TECHNIQUE_RE.fullmatch(str(tid))
+                ]
         
         # Validate tactics (alphanumeric only)
         if 'tactics' in metadata:
-            metadata['tactics'] = [
-                tactic for tactic in metadata['tactics']
-                if re.match(r'^[a-zA-Z0-9\s]+$', str(tactic))
-            ]
+            tactics = metadata['tactics']
+            if not all(_TACTIC_RE.fullmatch(str(tactic)) for tactic in tactics):
+                metadata['tactics'] = [
+                    tactic for tactic in tactics
+                    if _TACTIC_RE.fullmatch(str(tactic))
+                ]
         
         # Sanitize client_id (alphanumeric and underscore only)
         if 'client_id' in metadata:
-            metadata['client_id'] = re.sub(r'[^\w-]', '', str(metadata['client_id']))[:100]
+            client_id = str(metadata['client_id'])
+            if not _CLIENT_ID_CLEAN_RE.fullmatch(client_id):
+                client_id = _CLIENT_ID_STRIP_RE.sub('', client_id)[:100]
+            metadata['client_id'] = client_id
         
         return metadata
     
@@ -148,29 +206,42 @@ class ELKTagger:
         Returns:
             ECS-compatible metadata dictionary
         """
-        # Extract techniques and tactics from operation chain
-        techniques = []
-        tactics = []
+        # Single pass over the chain: dedupe in first-seen order and stop keeping
+        # techniques once the cap is hit (the total unique count is still tracked)
+        techniques_list = []
+        tactics_list = []
         ability_names = []
+        seen_techniques = set()
+        seen_tactics = set()
+        ability_count = 0
+        
+        # Any iterable chain works (links are consumed once, never copied)
+        chain = getattr(operation, 'chain', None) or ()
+        for link in chain:
+            ability = getattr(link, 'ability', None)
+            if ability is None:
+                continue
+            
+            technique_id = getattr(ability, 'technique_id', None)
+            if technique_id and technique_id not in seen_techniques:
+                seen_techniques.add(technique_id)
+                if len(techniques_list) < _MAX_TECHNIQUES:
+                    techniques_list.append(technique_id)
+            
+            tactic = getattr(ability, 'tactic', None)
+            if tactic and tactic not in seen_tactics:
+                seen_tactics.add(tactic)
+                tactics_list.append(tactic)
+            
+            name = getattr(ability, 'name', None)
+            if name:
+                ability_count += 1
+                if len(ability_names) < _MAX_ABILITY_NAMES:
+                    ability_names.append(name)
         
-        if hasattr(operation, 'chain') and operation.chain:
-            for link in operation.chain:
-                if hasattr(link, 'ability'):
-                    ability = link.ability
-                    if hasattr(ability, 'technique_id') and ability.technique_id:
-                        techniques.append(ability.technique_id)
-                    if hasattr(ability, 'tactic') and ability.tactic:
-                        tactics.append(ability.tactic)
-                    if hasattr(ability, 'name') and ability.name:
-                        ability_names.append(ability.name)
-        
-        # Deduplicate and limit
-        techniques_list = list(set(techniques))
-        tactics_list = list(set(tactics))
-        
-        if len(techniques_list) > 500:
-            self.log.warning(f'Truncated {len(techniques_list)} techniques to 500')
-            techniques_list = techniques_list[:500]
+        technique_count_total = len(seen_techniques)
+        if technique_count_total > _MAX_TECHNIQUES:
+            self.log.warning(f'Truncated {technique_count_total} techniques to {_MAX_TECHNIQUES}')
         
         # Build ECS-compatible document with purple.* namespace
         metadata = {
@@ -187,18 +258,18 @@ class ELKTagger:
                 'operation_name': getattr(operation, 'name', 'Unknown'),
                 'agent_id': getattr(operation, 'group', 'unknown'),
                 'detection_status': 'pending',  # Updated by detection correlation
-                'ability_count': len(ability_names),
+                'ability_count': ability_count,
                 'technique_count': len(techniques_list),
                 'status': getattr(operation, 'state', 'unknown')
                 #'output': ()
             },
             
             # Tags for Kibana filtering (purple_T1078, purple_TA0007)
-            'tags': (
-                ['purple_team', 'caldera', 'tl_labs', 'simulation'] +
-                [f'purple_{t}' for t in techniques_list[:50]] +
-                [f'purple_{tac}' for tac in tactics_list[:20]]
-            ),
+            'tags': [
+                'purple_team', 'caldera', 'tl_labs', 'simulation',
+                *(f'purple_{t}' for t in islice(techniques_list, 50)),
+                *(f'purple_{tac}' for tac in islice(tactics_list, 20))
+            ],
             
             # Legacy flat fields (backward compatibility)
             'operation_id': str(operation.id),
@@ -207,7 +278,8 @@ class ELKTagger:
             'client_id': getattr(operation, 'group', 'unknown'),
             'techniques': techniques_list,
             'tactics': tactics_list,
-            'abilities': ability_names[:100],
+            'abilities': ability_names,
+            'technique_count_total': technique_count_total,
             'severity': 'low',
             'auto_close': True,
             'agent_count': len(getattr(operation, 'agents', [])),
@@ -264,12 +336,16 @@ class ELKTagger:
             
             raise e
     
-    async def _write_fallback(self, metadata: Dict[str, Any]) -> Path:
+    def _write_fallback(self, records: List[Dict[str, Any]]) -> Path:
         """
-        Write metadata to fallback JSON file.
+        Append metadata records to the daily fallback NDJSON log.
+        
+        Records are appended to fallback-YYYYMMDD.ndjson (one JSON document per
+        line) so an ELK outage doesn't create one file per failed tag.
+        Blocking; the fallback writer runs it via asyncio.to_thread().
         
         Args:
-            metadata: Metadata dictionary
+            records: Metadata dictionaries to append
             
         Returns:
             Path to fallback file
@@ -286,22 +362,111 @@ class ELKTagger:
         except Exception as e:
             self.log.warning(f'Could not check disk space: {e}')
         
-        timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-        filename = f'fallback_{timestamp}_{metadata["operation_id"][:8]}.json'
-        filepath = self.fallback_dir / filename
+        filepath = self.fallback_dir / f'fallback-{datetime.utcnow().strftime("%Y%m%d")}.ndjson'
         
         try:
-            # Use synchronous write since we're already in fallback mode
-            with open(filepath, 'w') as f:
-                f.write(json.dumps(metadata, indent=2))
+            with self._fallback_lock:
+                # Rotate on day change (or if fallback_dir was repointed)
+                if filepath != self._fallback_path:
+                    self._close_fallback()
+                    self._fallback_fp = open(filepath, 'ab')
+                    self._fallback_path = filepath
+                
+                self._fallback_fp.write(b''.join(_fallback_bytes(r) for r in records))
+                self._fallback_fp.flush()
             
-            self.log.warning(f'Fallback log written: {filepath.name}')
             return filepath
         
         except Exception as e:
             self.log.error(f'Failed to write fallback log: {e}')
             raise
     
+    def _enqueue_fallback(self, metadata: Dict[str, Any]):
+        """
+        Queue metadata for the fallback log without waiting on disk I/O.
+        
+        Drops the oldest queued record when the queue is full so memory stays
+        bounded during a long ELK outage.
+        
+        Args:
+            metadata: Metadata dictionary
+        """
+        if self._fallback_writer is None:
+            self._fallback_writer = asyncio.create_task(self._fallback_writer_loop())
+        
+        try:
+            self._fallback_queue.put_nowait(metadata)
+        except asyncio.QueueFull:
+            dropped = self._fallback_queue.get_nowait()
+            self._fallback_queue.task_done()
+            self.log.error(f'Fallback queue full, dropped oldest: {str(dropped.get("operation_id"))[:16]}...')
+            self._fallback_queue.put_nowait(metadata)
+    
+    async def _fallback_writer_loop(self):
+        """Drain queued fallback records to disk, batching whatever has accumulated."""
+        while True:
+            records = [await self._fallback_queue.get()]
+            while not self._fallback_queue.empty():
+                records.append(self._fallback_queue.get_nowait())
+            
+            try:
+                filepath = await asyncio.to_thread(self._write_fallback, records)
+                self.log.warning(f'Fallback log written: {len(records)} record(s) to {filepath.name}')
+            except Exception as e:
+                self.log.error(f'Fallback logging failed ({len(records)} record(s) lost): {e}')
+            finally:
+                for _ in records:
+                    self._fallback_queue.task_done()
+    
+    def tag_fallback(self, operation):
+        """
+        Write an operation's tag straight to the fallback log, skipping ELK.
+        
+        Used as back-pressure when tags arrive faster than ELK can take them.
+        
+        Args:
+            operation: Caldera operation object
+        """
+        metadata = self._prepare_metadata(operation)
+        if metadata is not None:
+            self._enqueue_fallback(metadata)
+    
+    def _close_fallback(self):
+        """Close the open fallback log handle, if any."""
+        if self._fallback_fp:
+            self._fallback_fp.close()
+        self._fallback_fp = None
+        self._fallback_path = None
+    
+    def _prepare_metadata(self, operation) -> Optional[Dict[str, Any]]:
+        """
+        Validate an operation and build its sanitized metadata.
+        
+        Args:
+            operation: Caldera operation object
+            
+        Returns:
+            Sanitized metadata dictionary, or None if the operation can't be tagged
+        """
+        if not operation:
+            self.log.warning('tag() called with None operation')
+            return None
+        
+        if not hasattr(operation, 'id') or not operation.id:
+            self.log.warning('Operation missing ID attribute')
+            return None
+        
+        if not self._is_valid_operation_id(operation.id):
+            self.log.warning(f'Invalid operation ID format: {str(operation.id)[:16]}...')
+            return None
+        
+        try:
+            metadata = self._build_metadata(operation)
+            return self._sanitize_metadata(metadata)
+        except Exception as e:
+            self.log.error(f'Failed to build metadata: {e}')
+            return None
+    
     async def tag(self, operation) -> Optional[Dict[str, Any]]:
         """
         Tag operation in Elasticsearch (with fallback).
@@ -314,25 +479,8 @@ class ELKTagger:
         """
         # Use semaphore to limit concurrent tags
         async with self._tag_semaphore:
-            # Validate operation
-            if not operation:
-                self.log.warning('tag() called with None operation')
-                return None
-            
-            if not hasattr(operation, 'id') or not operation.id:
-                self.log.warning('Operation missing ID attribute')
-                return None
-            
-            if not self._is_valid_operation_id(operation.id):
-                self.log.warning(f'Invalid operation ID format: {str(operation.id)[:16]}...')
-                return None
-            
-            # Build and sanitize metadata
-            try:
-                metadata = self._build_metadata(operation)
-                metadata = self._sanitize_metadata(metadata)
-            except Exception as e:
-                self.log.error(f'Failed to build metadata: {e}')
+            metadata = self._prepare_metadata(operation)
+            if metadata is None:
                 return None
             
             # Try ELK first
@@ -344,12 +492,107 @@ class ELKTagger:
                     self.log.error(f'ELK POST failed: {str(e)[:100]}')
             
             # Fallback to file
-            try:
-                await asyncio.to_thread(self._write_fallback, metadata)
-                return None
-            except Exception as e:
-                self.log.error(f'Fallback logging failed: {e}')
-                return None
+            self._enqueue_fallback(metadata)
+            return None
+    
+    async def tag_many(self, operations: List) -> int:
+        """
+        Tag several operations with bulk requests (with fallback).
+        
+        Documents that fail to index (per item, or because the bulk request
+        itself failed) are written to the fallback log. A failed bulk request,
+        or a batch where no document was indexed, counts as one circuit
+        breaker failure.
+        
+        Args:
+            operations: Caldera operation objects
+            
+        Returns:
+            Number of operations indexed in ELK
+        """
+        async with self._tag_semaphore:
+            docs = [m for m in map(self._prepare_metadata, operations) if m is not None]
+            if not docs:
+                return 0
+            
+            indexed = 0
+            failed = docs
+            
+            if self.elk_client and async_streaming_bulk and not self._circuit_open:
+                failed = []
+                sent = 0
+                bulk_error = False
+                actions = ({'_index': self.config.ELK_INDEX, '_source': m} for m in docs)
+                
+                try:
+                    async with asyncio.timeout(60):
+                        # Results come back in action order, so failures map onto docs
+                        async for ok, item in async_streaming_bulk(
+                            self.elk_client,
+                            actions,
+                            chunk_size=_BULK_CHUNK_SIZE,
+                            max_chunk_bytes=_BULK_MAX_CHUNK_BYTES,
+                            raise_on_error=False,
+                            raise_on_exception=False,
+                        ):
+                            if ok:
+                                indexed += 1
+                            else:
+                                failed.append(docs[sent])
+                                # raise_on_exception=False reports a failed bulk request
+                                # (5xx, 429) as per-item failures instead of raising
+                                bulk_error = bulk_error or self._is_bulk_request_error(item)
+                            sent += 1
+                    
+                    if indexed and not bulk_error:
+                        # Reset failure counter on success
+                        self._failure_count = 0
+                        self._circuit_open = False
+                    else:
+                        self._record_bulk_failure()
+                        self.log.error(f'ELK bulk POST failed: {len(failed)} of {sent} documents not indexed')
+                
+                except (asyncio.TimeoutError, ConnectionError, TransportError) as e:
+                    failed.extend(docs[sent:])
+                    self._record_bulk_failure()
+                    self.log.error(f'ELK bulk POST failed: {str(e)[:100]}')
+                
+                except Exception as e:
+                    failed.extend(docs[sent:])
+                    self.log.error(f'ELK bulk POST error: {str(e)[:100]}')
+            
+            if indexed:
+                self.log.info(f'ELK tagged {indexed} operations in bulk')
+            
+            # Fallback to file
+            for metadata in failed:
+                self._enqueue_fallback(metadata)
+            
+            return indexed
+    
+    @staticmethod
+    def _is_bulk_request_error(item: Dict[str, Any]) -> bool:
+        """
+        Whether a failed bulk item reflects the whole request failing.
+        
+        Document errors (e.g. a 400 mapping conflict) don't count; server
+        errors (5xx) and throttling (429) do.
+        
+        Args:
+            item: Bulk response item, e.g. {'index': {'status': 503, ...}}
+            
+        Returns:
+            True for server errors and throttling
+        """
+        status = next(iter(item.values()), {}).get('status')
+        return not isinstance(status, int) or status >= 500 or status == 429
+    
+    def _record_bulk_failure(self):
+        """Count a failed bulk request, opening the circuit breaker at the limit."""
+        self._failure_count += 1
+        if self._failure_count >= self._max_failures:
+            self._circuit_open = True
+            self.log.error(f'Circuit breaker opened after {self._max_failures} failures')
     
     def _map_link_status(self, status_code: int) -> str:
         """Map Caldera link status code to human-readable string."""
@@ -372,11 +615,19 @@ class ELKTagger:
                 self.log.warning('tag_link() called with invalid link')
                 return None
             
-            if not link.ability:
+            ability = link.ability
+            if not ability:
                 self.log.warning(f'Link {link.id[:8]}... missing ability')
                 return None
             
             try:
+                # Read each ability field once; several appear in both the
+                # purple block and the top-level copy
+                technique_id = getattr(ability, 'technique_id', None)
+                tactic = getattr(ability, 'tactic', None)
+                ability_name = getattr(ability, 'name', None)
+                agent_paw = link.paw if hasattr(link, 'paw') else None
+                
                 execution_time = None
                 if hasattr(link, 'collect') and link.collect:
                     execution_time = link.collect.isoformat() if hasattr(link.collect, 'isoformat') else str(link.collect)
@@ -434,13 +685,13 @@ class ELKTagger:
                         'link_id': str(link.id),
                         'operation_id': str(operation.id),
                         'operation_name': getattr(operation, 'name', 'Unknown'),
-                        'technique': getattr(link.ability, 'technique_id', None),
-                        'technique_name': getattr(link.ability, 'technique_name', None),
-                        'tactic': getattr(link.ability, 'tactic', None),
-                        'ability_id': getattr(link.ability, 'ability_id', None),
-                        'ability_name': getattr(link.ability, 'name', None),
-                        'ability_description': getattr(link.ability, 'description', None)[:500] if hasattr(link.ability, 'description') else None,
-                        'agent_paw': link.paw if hasattr(link, 'paw') else None,
+                        'technique': technique_id,
+                        'technique_name': getattr(ability, 'technique_name', None),
+                        'tactic': tactic,
+                        'ability_id': getattr(ability, 'ability_id', None),
+                        'ability_name': ability_name,
+                        'ability_description': ability.description[:500] if hasattr(ability, 'description') else None,
+                        'agent_paw': agent_paw,
                         'agent_host': link.host if hasattr(link, 'host') else None,
                         'executor': link.executor.name if hasattr(link, 'executor') and link.executor and hasattr(link.executor, 'name') else None,
                         'platform': link.executor.platform if hasattr(link, 'executor') and link.executor and hasattr(link.executor, 'platform') else None,
@@ -455,7 +706,7 @@ class ELKTagger:
                     },
                     'tags': [
                         'purple_team', 'caldera', 'tl_labs', 'link_execution',
-                        f'purple_{link.ability.technique_id}' if link.ability.technique_id else 'purple_unknown',
+                        f'purple_{technique_id}' if technique_id else 'purple_unknown',
                         f'purple_link_{link.id[:8]}'
                     ],
                     'event': {
@@ -468,10 +719,10 @@ class ELKTagger:
                     'link_id': str(link.id),
                     'operation_id': str(operation.id),
                     'purple_team_exercise': True,
-                    'technique': getattr(link.ability, 'technique_id', None),
-                    'tactic': getattr(link.ability, 'tactic', None),
-                    'ability_name': getattr(link.ability, 'name', None),
-                    'agent_paw': link.paw if hasattr(link, 'paw') else None
+                    'technique': technique_id,
+                    'tactic': tactic,
+                    'ability_name': ability_name,
+                    'agent_paw': agent_paw
                 }
                 
                 metadata = self._sanitize_metadata(metadata)
@@ -493,8 +744,8 @@ class ELKTagger:
                     
                     self.log.info(
                         f'ELK tagged link: {link.id[:8]}... '
-                        f'({link.ability.technique_id if link.ability.technique_id else "NO_TID"} - '
-                        f'{link.ability.name if link.ability.name else "NO_NAME"}) '
+                        f'({technique_id or "NO_TID"} - '
+                        f'{ability_name or "NO_NAME"}) '
                         f'status={self._map_link_status(link.status)}'
                     )
                     return response
@@ -510,21 +761,22 @@ class ELKTagger:
                 except Exception as e:
                     self.log.error(f'Link ELK POST error: {str(e)[:100]}')
             
-            try:
-                timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-                filename = f'fallback_link_{timestamp}_{link.id[:8]}.json'
-                filepath = self.fallback_dir / filename
-                
-                with open(filepath, 'w') as f:
-                    f.write(json.dumps(metadata, indent=2))
-                
-                self.log.warning(f'Link fallback log written: {filepath.name}')
-                return None
-            except Exception as e:
-                self.log.error(f'Link fallback logging failed: {e}')
-                return None
+            self._enqueue_fallback(metadata)
+            return None
     
     async def close(self):
-        """Close ELK client connection."""
+        """Flush queued fallback records, then close the fallback log and ELK client."""
+        if self._fallback_writer is not None:
+            try:
+                await asyncio.wait_for(self._fallback_queue.join(), timeout=10)
+            except asyncio.TimeoutError:
+                self.log.error(f'Dropping {self._fallback_queue.qsize()} queued fallback records on close')
+            self._fallback_writer.cancel()
+            await asyncio.gather(self._fallback_writer, return_exceptions=True)
+            self._fallback_writer = None
+        
+        with self._fallback_lock:
+            self._close_fallback()
+        
         if self.elk_client:
             await self.elk_client.close()
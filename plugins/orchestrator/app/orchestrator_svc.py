@@ -4,13 +4,27 @@ Orchestrator service coordinator.
 Subscribes to operation events and delegates to specialized services (ELK tagger, health checker).
 """
 
+import asyncio
 import json
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from plugins.orchestrator.app.config import OrchestratorConfig
 from plugins.orchestrator.app.elk_tagger import ELKTagger
 
 
+def _dumps(obj) -> str:
+    """Serialize API responses with orjson when installed, stdlib json otherwise."""
+    if orjson:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
 class OrchestratorService:
     """
     Orchestrator plugin service.
@@ -21,7 +35,12 @@ class OrchestratorService:
     - Provide health check API (Phase 5)
     """
     
-    _services = {}  # Class-level service registry
+    # Tag queue sizing (decouples event handlers from ELK round-trips)
+    TAG_QUEUE_SIZE = 10_000
+    TAG_WORKERS = 4
+    TAG_BATCH_SIZE = 500
+    TAG_BATCH_WINDOW = 0.05  # seconds to wait for more operations before sending a batch
+    TAG_FLUSH_TIMEOUT = 10  # seconds shutdown waits for ELK before using the fallback log
     
     def __init__(self, services: Dict[str, Any]):
         """
@@ -40,8 +59,124 @@ class OrchestratorService:
         # Initialize ELK tagger
         self.elk_tagger = ELKTagger(self.log)
         
+        # Static config reported by /status (resolved once, after validate() loaded it)
+        self._elk_url = OrchestratorConfig.ELK_URL
+        self._elk_index = OrchestratorConfig.ELK_INDEX
+        self._fallback_dir = str(OrchestratorConfig.FALLBACK_LOG_DIR)
+        
+        # Bounded tag queue drained by a fixed worker pool (workers start on first event)
+        self._tag_queue = asyncio.Queue(maxsize=self.TAG_QUEUE_SIZE)
+        self._tag_workers = []
+        
         self.log.info('OrchestratorService initialized')
     
+    def _enqueue_tag(self, operation):
+        """
+        Queue an operation for ELK tagging without waiting on the ELK round-trip.
+        
+        When the queue is full (ELK can't keep up), the operation is written
+        straight to the fallback log instead, so memory stays bounded, no tag
+        is lost and the websocket receive loop is never blocked.
+        
+        Args:
+            operation: Caldera operation object
+        """
+        if not self._tag_workers:
+            self._tag_workers = [
+                asyncio.create_task(self._tag_worker()) for _ in range(self.TAG_WORKERS)
+            ]
+        
+        try:
+            self._tag_queue.put_nowait(operation)
+        except asyncio.QueueFull:
+            self.log.warning(f'[orchestrator] Tag queue full, writing to fallback: {str(operation.id)[:16]}...')
+            self.elk_tagger.tag_fallback(operation)
+    
+    async def _tag_worker(self):
+        """
+        Consume queued operations and tag them in ELK.
+        
+        After the first operation arrives, keeps collecting for up to
+        TAG_BATCH_WINDOW (or TAG_BATCH_SIZE operations) so bursts go out as one
+        bulk request. A batch still in hand when the worker is cancelled
+        (shutdown gave up waiting on ELK) goes to the fallback log.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._tag_queue.get()]
+            try:
+                try:
+                    async with asyncio.timeout_at(loop.time() + self.TAG_BATCH_WINDOW):
+                        while len(batch) < self.TAG_BATCH_SIZE:
+                            batch.append(await self._tag_queue.get())
+                except TimeoutError:
+                    pass
+                
+                if len(batch) == 1:
+                    await self.elk_tagger.tag(batch[0])
+                else:
+                    await self.elk_tagger.tag_many(batch)
+            except asyncio.CancelledError:
+                # May duplicate documents ELK already took, but none are lost
+                for operation in batch:
+                    self.elk_tagger.tag_fallback(operation)
+                raise
+            except Exception as e:
+                self.log.error(f'[orchestrator] Operation tagging failed (non-fatal): {e}', exc_info=True)
+            finally:
+                for _ in batch:
+                    self._tag_queue.task_done()
+    
+    async def _read_operation_event(self, socket, event_label: str) -> Optional[Dict[str, Any]]:
+        """
+        Read an operation event from the websocket and validate its operation ID.
+        
+        Args:
+            socket: Websocket connection object
+            event_label: Event name used in log messages (e.g., 'Completed')
+            
+        Returns:
+            Parsed event data, or None if the operation ID is missing/empty
+        """
+        message_data = await socket.recv()
+        event_data = json.loads(message_data)
+        
+        try:
+            op_id = event_data['op']
+        except KeyError:
+            self.log.warning(f'[orchestrator] {event_label} event missing operation ID')
+            return None
+        
+        if not op_id:
+            self.log.warning(f'[orchestrator] {event_label} event has empty operation ID')
+            return None
+        
+        return event_data
+    
+    async def _locate_operation(self, services, op_id: str, short_id: str):
+        """
+        Fetch an operation object from data_svc by ID.
+        
+        Args:
+            services: Caldera service registry
+            op_id: Operation ID
+            short_id: Truncated operation ID for log messages
+            
+        Returns:
+            Operation object, or None if data_svc is unavailable or no match exists
+        """
+        data_svc = services.get('data_svc')
+        if not data_svc:
+            self.log.error('[orchestrator] data_svc not available')
+            return None
+        
+        operations = await data_svc.locate('operations', match=dict(id=op_id))
+        if not operations:
+            self.log.warning(f'[orchestrator] Operation not found: {short_id}...')
+            return None
+        
+        return operations[0]
+    
     async def on_operation_state_changed(self, socket, path, services):
         """
         Event handler: Tag operation when state changes.
@@ -55,34 +190,22 @@ class OrchestratorService:
             services: Caldera service registry
         """
         try:
-            # Read and parse JSON message from websocket
-            message_data = await socket.recv()
-            event_data = json.loads(message_data)
+            event_data = await self._read_operation_event(socket, 'State change')
+            if event_data is None:
+                return
             
-            # Extract event parameters
-            op_id = event_data.get('op')
+            op_id = event_data['op']
+            short_id = op_id[:16]
             from_state = event_data.get('from_state')
             to_state = event_data.get('to_state')
             
-            if not op_id:
-                self.log.warning('[orchestrator] State change event missing operation ID')
-                return
-            
-            self.log.info(f'[orchestrator] State change: {op_id[:16]}... ({from_state} → {to_state})')
+            self.log.info(f'[orchestrator] State change: {short_id}... ({from_state} → {to_state})')
             
-            # Fetch operation object from data_svc using ID
-            data_svc = services.get('data_svc')
-            if not data_svc:
-                self.log.error('[orchestrator] data_svc not available')
-                return
-            
-            operations = await data_svc.locate('operations', match=dict(id=op_id))
-            if not operations:
-                self.log.warning(f'[orchestrator] Operation not found: {op_id[:16]}...')
+            operation = await self._locate_operation(services, op_id, short_id)
+            if operation is None:
                 return
             
-            operation = operations[0]
-            await self.elk_tagger.tag(operation)
+            self._enqueue_tag(operation)
             
         except Exception as e:
             # Non-fatal error (don't break operation)
@@ -101,33 +224,21 @@ class OrchestratorService:
             services: Caldera service registry
         """
         try:
-            # Read and parse JSON message from websocket
-            message_data = await socket.recv()
-            event_data = json.loads(message_data)
-            
-            # Extract operation ID from event data
-            op_id = event_data.get('op')
-            
-            if not op_id:
-                self.log.warning('[orchestrator] Completed event missing operation ID')
+            event_data = await self._read_operation_event(socket, 'Completed')
+            if event_data is None:
                 return
             
-            # Fetch operation object from data_svc using ID
-            data_svc = services.get('data_svc')
-            if not data_svc:
-                self.log.error('[orchestrator] data_svc not available')
-                return
+            op_id = event_data['op']
+            short_id = op_id[:16]
             
-            operations = await data_svc.locate('operations', match=dict(id=op_id))
-            if not operations:
-                self.log.warning(f'[orchestrator] Operation not found: {op_id[:16]}...')
+            operation = await self._locate_operation(services, op_id, short_id)
+            if operation is None:
                 return
             
-            operation = operations[0]
-            self.log.info(f'[orchestrator] Operation finished: {op_id[:16]}... (state: {operation.state})')
+            self.log.info(f'[orchestrator] Operation finished: {short_id}... (state: {operation.state})')
             
             # Update operation status in ELK (re-tag with final state)
-            await self.elk_tagger.tag(operation)
+            self._enqueue_tag(operation)
             
             # Note: PDF report generation is handled automatically by the reporting plugin
             # via event subscription (reporting plugin listens to operation.completed events)
@@ -195,6 +306,23 @@ class OrchestratorService:
         """Shutdown orchestrator service and cleanup resources."""
         self.log.info('Shutting down orchestrator service...')
         
+        # Give queued tags a chance to flush, then stop the workers
+        if self._tag_workers:
+            try:
+                await asyncio.wait_for(self._tag_queue.join(), timeout=self.TAG_FLUSH_TIMEOUT)
+            except asyncio.TimeoutError:
+                # ELK is too slow to drain the queue: send the rest to the
+                # fallback log (flushed by elk_tagger.close() below)
+                self.log.warning(f'Writing {self._tag_queue.qsize()} queued tags to fallback on shutdown')
+                while not self._tag_queue.empty():
+                    self.elk_tagger.tag_fallback(self._tag_queue.get_nowait())
+                    self._tag_queue.task_done()
+        
+        for worker in self._tag_workers:
+            worker.cancel()
+        await asyncio.gather(*self._tag_workers, return_exceptions=True)
+        self._tag_workers = []
+        
         try:
             # Close ELK client
             await self.elk_tagger.close()
@@ -210,7 +338,6 @@ class OrchestratorService:
             JSON with ELK connectivity, circuit breaker state, config
         """
         from aiohttp import web
-        from plugins.orchestrator.app.config import OrchestratorConfig
         
         elk_status = 'unknown'
         elk_error = None
@@ -232,15 +359,15 @@ class OrchestratorService:
             'elk': {
                 'status': elk_status,
                 'error': elk_error,
-                'url': OrchestratorConfig.ELK_URL,
-                'index': OrchestratorConfig.ELK_INDEX,
+                'url': self._elk_url,
+                'index': self._elk_index,
                 'circuit_breaker_open': self.elk_tagger._circuit_open,
                 'failure_count': self.elk_tagger._failure_count
             },
-            'fallback_dir': str(OrchestratorConfig.FALLBACK_LOG_DIR)
+            'fallback_dir': self._fallback_dir
         }
         
-        return web.json_response(status)
+        return web.json_response(status, dumps=_dumps)
     
     async def tag_test_endpoint(self, request):
         """
@@ -277,14 +404,14 @@ class OrchestratorService:
                     'operation_id': mock_op.id,
                     'elk_doc_id': result.get('_id'),
                     'index': result.get('_index')
-                })
+                }, dumps=_dumps)
             else:
                 return web.json_response({
                     'status': 'fallback',
                     'message': 'ELK unavailable, written to fallback log',
                     'operation_id': mock_op.id,
                     'fallback_dir': str(self.elk_tagger.fallback_dir)
-                })
+                }, dumps=_dumps)
                 
         except Exception as e:
             self.log.error(f'Tag test failed: {e}', exc_info=True)
@@ -292,4 +419,4 @@ class OrchestratorService:
                 'status': 'error',
                 'message': str(e)[:500],
                 'operation_id': mock_op.id
-            }, status=500)
+            }, status=500, dumps=_dumps)
@@ -1,10 +1,40 @@
 """Pytest fixtures for orchestrator plugin tests."""
 
 import pytest
+from dataclasses import dataclass
+from typing import Optional, Tuple
 from unittest.mock import MagicMock, AsyncMock
 from datetime import datetime
 
 
+@dataclass(frozen=True, slots=True)
+class FakeAbility:
+    """Plain stand-in for a Caldera ability (only the fields ELKTagger reads)."""
+    technique_id: str
+    tactic: str
+    name: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class FakeLink:
+    """Plain stand-in for a Caldera link."""
+    ability: FakeAbility
+    status: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class FakeOperation:
+    """Plain stand-in for a Caldera operation (frozen: session fixtures are shared)."""
+    id: str
+    name: str
+    group: str
+    state: str
+    agents: Tuple[str, ...] = ()
+    chain: Tuple[FakeLink, ...] = ()
+    start: Optional[datetime] = None
+    finish: Optional[datetime] = None
+
+
 @pytest.fixture
 def mock_logger():
     """Mock Python logger."""
@@ -16,47 +46,54 @@ def mock_logger():
     return logger
 
 
-@pytest.fixture
+# Operation fixtures are read-only in tests, so build them once per session
+# (frozen, so an accidental mutation raises instead of leaking into other tests).
+# Mocks whose calls are asserted on (logger, ELK client) stay function-scoped.
+
+@pytest.fixture(scope='session')
 def mock_operation():
     """Mock Caldera operation with complete attributes."""
-    op = MagicMock()
-    op.id = 'test-operation-abc123'
-    op.name = 'Discovery & Credential Access'
-    op.group = 'client_acme'
-    op.state = 'running'
-    op.start = datetime(2026, 1, 6, 10, 0, 0)
-    op.finish = None
-    op.agents = ['agent1', 'agent2']
-    
     # Mock technique chain
-    link1 = MagicMock()
-    link1.ability.technique_id = 'T1078'
-    link1.ability.name = 'Valid Accounts'
-    link1.ability.tactic = 'Persistence'
-    link1.status = 0
+    link1 = FakeLink(FakeAbility('T1078', 'Persistence', name='Valid Accounts'))
+    link2 = FakeLink(FakeAbility('T1059.001', 'Execution', name='PowerShell'))
     
-    link2 = MagicMock()
-    link2.ability.technique_id = 'T1059.001'
-    link2.ability.name = 'PowerShell'
-    link2.ability.tactic = 'Execution'
-    link2.status = 0
-    
-    op.chain = [link1, link2]
-    
-    return op
+    return FakeOperation(
+        id='test-operation-abc123',
+        name='Discovery & Credential Access',
+        group='client_acme',
+        state='running',
+        start=datetime(2026, 1, 6, 10, 0, 0),
+        finish=None,
+        agents=('agent1', 'agent2'),
+        chain=(link1, link2)
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def mock_operation_empty_chain():
     """Mock operation with no techniques."""
-    op = MagicMock()
-    op.id = 'empty-op-123'
-    op.name = 'Empty Operation'
-    op.group = 'test_client'
-    op.state = 'finished'
-    op.agents = []
-    op.chain = []
-    return op
+    return FakeOperation(
+        id='empty-op-123',
+        name='Empty Operation',
+        group='test_client',
+        state='finished'
+    )
+
+
+@pytest.fixture(scope='session')
+def mock_operation_large_chain():
+    """Mock operation with 600 unique techniques (exceeds the 500 technique cap)."""
+    chain = tuple(
+        FakeLink(FakeAbility(f'T{1000 + i}', 'Discovery'))
+        for i in range(600)
+    )
+    return FakeOperation(
+        id='test-123',
+        name='Test',
+        group='client',
+        state='running',
+        chain=chain
+    )
 
 
 @pytest.fixture
@@ -74,3 +111,14 @@ def mock_elk_client():
     client.close = AsyncMock()
     
     return client
+
+
+@pytest.fixture
+def mock_elk_tagger():
+    """Mock ELKTagger (tag/tag_many succeed, tag_fallback records the operation)."""
+    tagger = MagicMock()
+    tagger.tag = AsyncMock(return_value={'_id': 'elk-doc-123'})
+    tagger.tag_many = AsyncMock(side_effect=lambda operations: len(operations))
+    tagger.tag_fallback = MagicMock()
+    tagger.close = AsyncMock()
+    return tagger
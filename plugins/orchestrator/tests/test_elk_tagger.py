@@ -3,6 +3,7 @@
 import pytest
 import asyncio
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock, AsyncMock
 from datetime import datetime
 import json
@@ -10,9 +11,12 @@ import json
 from plugins.orchestrator.app.elk_tagger import ELKTagger
 from plugins.orchestrator.app.config import OrchestratorConfig
 from plugins.orchestrator.tests.fixtures import (
+    FakeAbility,
+    FakeLink,
     mock_logger,
     mock_operation,
     mock_operation_empty_chain,
+    mock_operation_large_chain,
     mock_elk_client
 )
 
@@ -75,6 +79,27 @@ class TestELKTaggerValidation:
         # Path traversal removed
         assert '../' not in sanitized['client_id']
 
+    
+    def test_sanitize_metadata_leaves_clean_metadata_unchanged(self, mock_logger):
+        """Test already-clean metadata passes through without being rebuilt."""
+        tagger = ELKTagger(mock_logger)
+        
+        techniques = ['T1078', 'T1059.001']
+        tactics = ['Persistence', 'Execution']
+        metadata = {
+            'operation_name': 'Discovery and Credential Access',
+            'techniques': techniques,
+            'tactics': tactics,
+            'client_id': 'client_acme'
+        }
+        
+        sanitized = tagger._sanitize_metadata(metadata)
+        
+        assert sanitized['operation_name'] == 'Discovery and Credential Access'
+        assert sanitized['techniques'] is techniques
+        assert sanitized['tactics'] is tactics
+        assert sanitized['client_id'] == 'client_acme'
+
 
 class TestELKTaggerMetadata:
     """Test metadata building."""
@@ -111,23 +136,12 @@ class TestELKTaggerMetadata:
     
     def test_build_metadata_deduplicates_techniques(self, mock_logger):
         """Test duplicate technique removal."""
-        op = MagicMock()
-        op.id = 'test-123'
-        op.name = 'Test'
-        op.group = 'client'
-        op.agents = []
-        op.state = 'running'
-        
         # Duplicate techniques
-        link1 = MagicMock()
-        link1.ability.technique_id = 'T1078'
-        link1.ability.tactic = 'Persistence'
+        link1 = FakeLink(FakeAbility('T1078', 'Persistence'))
+        link2 = FakeLink(FakeAbility('T1078', 'Persistence'))  # Duplicate
         
-        link2 = MagicMock()
-        link2.ability.technique_id = 'T1078'  # Duplicate
-        link2.ability.tactic = 'Persistence'
-        
-        op.chain = [link1, link2]
+        op = SimpleNamespace(id='test-123', name='Test', group='client', agents=[], state='running',
+                             chain=[link1, link2])
         
         tagger = ELKTagger(mock_logger)
         metadata = tagger._build_metadata(op)
@@ -135,25 +149,11 @@ class TestELKTaggerMetadata:
         # Only one T1078
         assert metadata['techniques'].count('T1078') == 1
     
-    def test_build_metadata_truncates_large_technique_lists(self, mock_logger):
+    def test_build_metadata_truncates_large_technique_lists(self, mock_logger, mock_operation_large_chain):
         """Test technique list truncation at 500."""
-        op = MagicMock()
-        op.id = 'test-123'
-        op.name = 'Test'
-        op.group = 'client'
-        op.agents = []
-        op.state = 'running'
-        
-        # Create 600 unique techniques
-        op.chain = []
-        for i in range(600):
-            link = MagicMock()
-            link.ability.technique_id = f'T{1000 + i}'
-            link.ability.tactic = 'Discovery'
-            op.chain.append(link)
-        
+        # 600 unique techniques
         tagger = ELKTagger(mock_logger)
-        metadata = tagger._build_metadata(op)
+        metadata = tagger._build_metadata(mock_operation_large_chain)
         
         # Truncated to 500
         assert len(metadata['techniques']) == 500
@@ -214,20 +214,80 @@ class TestELKTaggerTagging:
         tagger.fallback_dir = tmp_path  # Use pytest temp directory
         
         response = await tagger.tag(mock_operation)
+        await tagger.close()
         
         # Returns None (fallback used)
         assert response is None
         
         # Fallback file created
-        fallback_files = list(tmp_path.glob('fallback_*.json'))
+        fallback_files = list(tmp_path.glob('fallback-*.ndjson'))
         assert len(fallback_files) == 1
         
-        # Fallback contains correct data
+        # Fallback contains one record with correct data
         with open(fallback_files[0]) as f:
-            data = json.load(f)
+            lines = f.read().splitlines()
+        assert len(lines) == 1
+        data = json.loads(lines[0])
         assert data['operation_id'] == 'test-operation-abc123'
         assert data['purple_team_exercise'] is True
     
+    async def test_tag_many_falls_back_for_failed_items(self, mock_logger, mock_operation,
+                                                        mock_operation_empty_chain, tmp_path):
+        """Test bulk tagging writes only the failed documents to the fallback log."""
+        async def fake_streaming_bulk(client, actions, **kwargs):
+            for i, action in enumerate(actions):
+                yield (i == 0), {'index': {'_index': action['_index'], 'status': 201 if i == 0 else 400}}
+        
+        tagger = ELKTagger(mock_logger)
+        tagger.elk_client = AsyncMock()
+        tagger.fallback_dir = tmp_path
+        
+        with patch('plugins.orchestrator.app.elk_tagger.async_streaming_bulk', fake_streaming_bulk):
+            indexed = await tagger.tag_many([mock_operation, mock_operation_empty_chain])
+        await tagger.close()
+        
+        assert indexed == 1
+        
+        # Only the failed operation was written to the fallback log
+        fallback_files = list(tmp_path.glob('fallback-*.ndjson'))
+        with open(fallback_files[0]) as f:
+            lines = f.read().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])['operation_id'] == 'empty-op-123'
+    
+    async def test_tag_many_bulk_error_opens_circuit_breaker(self, mock_logger, mock_operation,
+                                                             mock_operation_empty_chain, tmp_path):
+        """Test a rejected bulk request (503) counts as a circuit breaker failure."""
+        from elasticsearch import ApiError
+        from elastic_transport import ApiResponseMeta, HttpHeaders, NodeConfig
+        
+        meta = ApiResponseMeta(status=503, http_version='1.1', headers=HttpHeaders(),
+                               duration=0.0, node=NodeConfig('http', 'localhost', 9200))
+        elk_client = MagicMock()
+        elk_client.options.return_value = elk_client
+        elk_client.bulk = AsyncMock(side_effect=ApiError('service unavailable', meta, {}))
+        elk_client.close = AsyncMock()
+        
+        tagger = ELKTagger(mock_logger)
+        tagger.elk_client = elk_client
+        tagger.fallback_dir = tmp_path
+        tagger._max_failures = 3
+        
+        for _ in range(5):
+            indexed = await tagger.tag_many([mock_operation, mock_operation_empty_chain])
+            assert indexed == 0
+        await tagger.close()
+        
+        # The breaker opened at the limit and later batches skipped ELK
+        assert tagger._circuit_open is True
+        assert tagger._failure_count == 3
+        assert elk_client.bulk.await_count == 3
+        
+        # Every document of every batch reached the fallback log
+        fallback_files = list(tmp_path.glob('fallback-*.ndjson'))
+        lines = [line for path in fallback_files for line in path.read_text().splitlines()]
+        assert len(lines) == 10
+    
     async def test_tag_circuit_breaker_opens_after_failures(self, mock_logger, mock_operation):
         """Test circuit breaker pattern."""
         # Mock failing ELK client
@@ -0,0 +1,108 @@
+"""Unit tests for the orchestrator service tag queue."""
+
+import pytest
+import asyncio
+from types import SimpleNamespace
+
+from plugins.orchestrator.app.orchestrator_svc import OrchestratorService
+from plugins.orchestrator.tests.fixtures import mock_elk_tagger
+
+
+def _make_service(tagger) -> OrchestratorService:
+    """OrchestratorService with its ELK tagger swapped for a mock."""
+    svc = OrchestratorService({})
+    svc.elk_tagger = tagger
+    return svc
+
+
+def _operations(count: int) -> list:
+    return [SimpleNamespace(id=f'op-{i:04d}') for i in range(count)]
+
+
+@pytest.mark.asyncio
+class TestOrchestratorTagQueue:
+    """Test the tag queue and its worker pool."""
+    
+    async def test_enqueue_tag_starts_workers_lazily(self, mock_elk_tagger):
+        """Test workers start on the first queued operation, not at init."""
+        svc = _make_service(mock_elk_tagger)
+        assert svc._tag_workers == []
+        
+        svc._enqueue_tag(_operations(1)[0])
+        
+        assert len(svc._tag_workers) == svc.TAG_WORKERS
+        await svc.shutdown()
+    
+    async def test_enqueue_tag_falls_back_when_queue_full(self, mock_elk_tagger):
+        """Test a full queue sends the operation to the fallback log."""
+        svc = _make_service(mock_elk_tagger)
+        svc._tag_queue = asyncio.Queue(maxsize=1)
+        first, second = _operations(2)
+        
+        # Workers can't run between the two calls, so the second finds the queue full
+        svc._enqueue_tag(first)
+        svc._enqueue_tag(second)
+        
+        mock_elk_tagger.tag_fallback.assert_called_once_with(second)
+        await svc.shutdown()
+        mock_elk_tagger.tag.assert_awaited_once_with(first)
+    
+    async def test_single_operation_uses_tag_and_burst_uses_tag_many(self, mock_elk_tagger):
+        """Test a lone operation is tagged individually and a burst in one bulk call."""
+        svc = _make_service(mock_elk_tagger)
+        
+        svc._enqueue_tag(_operations(1)[0])
+        await svc._tag_queue.join()
+        
+        mock_elk_tagger.tag.assert_awaited_once()
+        mock_elk_tagger.tag_many.assert_not_awaited()
+        
+        burst = _operations(25)
+        for operation in burst:
+            svc._enqueue_tag(operation)
+        await svc._tag_queue.join()
+        
+        mock_elk_tagger.tag_many.assert_awaited_once_with(burst)
+        assert mock_elk_tagger.tag.await_count == 1
+        await svc.shutdown()
+    
+    @pytest.mark.parametrize('method', ['tag', 'tag_many'])
+    async def test_tag_worker_marks_batch_done_when_tagging_fails(self, mock_elk_tagger, method):
+        """Test task_done is still called for every operation when tagging raises."""
+        getattr(mock_elk_tagger, method).side_effect = RuntimeError('ELK exploded')
+        svc = _make_service(mock_elk_tagger)
+        
+        for operation in _operations(1 if method == 'tag' else 3):
+            svc._enqueue_tag(operation)
+        
+        await asyncio.wait_for(svc._tag_queue.join(), timeout=1)
+        
+        # The worker survives the failure and keeps consuming
+        assert not any(worker.done() for worker in svc._tag_workers)
+        await svc.shutdown()
+    
+    async def test_shutdown_writes_queued_tags_to_fallback_on_timeout(self, mock_elk_tagger):
+        """Test every unsent operation goes to the fallback log when the flush times out."""
+        stalled = asyncio.Event()
+        
+        async def tag_never_returns(operations):
+            await stalled.wait()
+        
+        mock_elk_tagger.tag_many.side_effect = tag_never_returns
+        svc = _make_service(mock_elk_tagger)
+        svc.TAG_WORKERS = 1
+        svc.TAG_BATCH_SIZE = 2
+        svc.TAG_FLUSH_TIMEOUT = 0.1
+        
+        operations = _operations(5)
+        for operation in operations:
+            svc._enqueue_tag(operation)
+        
+        await svc.shutdown()
+        
+        # Queued operations and the batch stuck in tag_many all reach the fallback log
+        fallback_ops = [call.args[0] for call in mock_elk_tagger.tag_fallback.call_args_list]
+        assert sorted(fallback_ops, key=lambda op: op.id) == operations
+        assert svc._tag_queue.empty()
+        assert svc._tag_workers == []
+        mock_elk_tagger.close.assert_awaited_once()
@@ -6,14 +6,20 @@ conf/local.yml and environment variables.
 """
 
 import os
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 import yaml
 from app.utility.base_world import BaseWorld
 
 
 class ReportingConfig:
-    """Configuration loader for reporting plugin."""
+    """
+    Configuration loader for reporting plugin.
+    
+    Settings are resolved lazily on first access and cached on the instance;
+    use get_reporting_config() to share one instance process-wide.
+    """
     
     def __init__(self, config_path: Optional[Path] = None):
         """
@@ -23,70 +29,119 @@ class ReportingConfig:
             config_path: Optional path to config file (defaults to conf/local.yml)
         """
         self.config_path = config_path or Path('conf/local.yml')
-        self._load_config()
     
-    def _load_config(self) -> None:
-        """Load configuration from file and environment variables."""
-        # Load from Caldera's BaseWorld config system
-        reporting_config = BaseWorld.get_config(prop='reporting', name='main') or {}
-        
-        # Report output directory
-        self.output_dir = Path(
+    @cached_property
+    def _settings(self) -> Dict[str, Any]:
+        """Reporting section of Caldera's BaseWorld config system."""
+        return BaseWorld.get_config(prop='reporting', name='main') or {}
+    
+    # Report output directory
+    @cached_property
+    def output_dir(self) -> Path:
+        output_dir = Path(
             os.getenv(
                 'REPORTING_OUTPUT_DIR',
-                reporting_config.get('output_dir', 'plugins/reporting/data/reports')
-            )
-        )
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # PDF generation settings
-        self.page_size = reporting_config.get('page_size', 'LETTER')
-        self.font_name = reporting_config.get('font_name', 'Helvetica')
-        self.font_size = int(reporting_config.get('font_size', 10))
-        
-        # Performance tuning
-        self.max_workers = int(
-            os.getenv(
-                'REPORTING_MAX_WORKERS',
-                reporting_config.get('max_workers', 3)
-            )
-        )
-        self.generation_timeout = int(
-            os.getenv(
-                'REPORTING_TIMEOUT',
-                reporting_config.get('generation_timeout', 30)
+                self._settings.get('output_dir', 'plugins/reporting/data/reports')
             )
         )
-        self.max_memory_mb = int(
-            os.getenv(
-                'REPORTING_MAX_MEMORY_MB',
-                reporting_config.get('max_memory_mb', 100)
-            )
-        )
-        
-        # Branding
-        self.company_name = reporting_config.get('company_name', 'Triskele Labs')
-        self.logo_path = Path(
-            reporting_config.get('logo_path', 'plugins/reporting/static/assets/triskele_logo.png')
+        output_dir.mkdir(parents=True, exist_ok=True)
+        return output_dir
+    
+    # PDF generation settings
+    @cached_property
+    def page_size(self) -> str:
+        return self._settings.get('page_size', 'LETTER')
+    
+    @cached_property
+    def font_name(self) -> str:
+        return self._settings.get('font_name', 'Helvetica')
+    
+    @cached_property
+    def font_size(self) -> int:
+        return int(self._settings.get('font_size', 10))
+    
+    @cached_property
+    def pdf_compress(self) -> bool:
+        # Deflate page streams; disable for faster, larger "preview" output
+        value = os.getenv('REPORTING_PDF_COMPRESS', self._settings.get('pdf_compress', True))
+        if isinstance(value, str):
+            return value.strip().lower() in ('1', 'true', 'yes')
+        return bool(value)
+    
+    # Performance tuning
+    @cached_property
+    def max_workers(self) -> int:
+        return int(os.getenv('REPORTING_MAX_WORKERS', self._settings.get('max_workers', 3)))
+    
+    @cached_property
+    def generation_timeout(self) -> int:
+        return int(os.getenv('REPORTING_TIMEOUT', self._settings.get('generation_timeout', 30)))
+    
+    @cached_property
+    def max_memory_mb(self) -> int:
+        return int(os.getenv('REPORTING_MAX_MEMORY_MB', self._settings.get('max_memory_mb', 100)))
+    
+    @cached_property
+    def use_processes(self) -> bool:
+        # Render PDFs in worker processes instead of threads
+        value = os.getenv('REPORTING_USE_PROCESSES', self._settings.get('use_processes', False))
+        if isinstance(value, str):
+            return value.strip().lower() in ('1', 'true', 'yes')
+        return bool(value)
+    
+    # Branding
+    @cached_property
+    def company_name(self) -> str:
+        return self._settings.get('company_name', 'Triskele Labs')
+    
+    @cached_property
+    def logo_path(self) -> Path:
+        return Path(
+            self._settings.get('logo_path', 'plugins/reporting/static/assets/triskele_logo.png')
         )
-        
-        # Colors (Triskele Labs brand colors)
-        self.primary_color = reporting_config.get('primary_color', '#0f3460')
-        self.accent_color = reporting_config.get('accent_color', '#16a085')
-        self.text_color = reporting_config.get('text_color', '#1F2937')
-        
-        # Feature flags
-        self.include_executive_summary = reporting_config.get('include_executive_summary', True)
-        self.include_tactic_coverage = reporting_config.get('include_tactic_coverage', True)
-        self.include_technique_details = reporting_config.get('include_technique_details', True)
+    
+    # Colors (Triskele Labs brand colors)
+    @cached_property
+    def primary_color(self) -> str:
+        return self._settings.get('primary_color', '#0f3460')
+    
+    @cached_property
+    def accent_color(self) -> str:
+        return self._settings.get('accent_color', '#16a085')
+    
+    @cached_property
+    def text_color(self) -> str:
+        return self._settings.get('text_color', '#1F2937')
+    
+    # Feature flags
+    @cached_property
+    def include_executive_summary(self) -> bool:
+        return self._settings.get('include_executive_summary', True)
+    
+    @cached_property
+    def include_tactic_coverage(self) -> bool:
+        return self._settings.get('include_tactic_coverage', True)
+    
+    @cached_property
+    def include_technique_details(self) -> bool:
+        return self._settings.get('include_technique_details', True)
     
     def validate(self) -> tuple[bool, list[str]]:
         """
         Validate configuration.
         
+        Settings are resolved once per instance, so the checks run on the first
+        call and later calls reuse the result.
+        
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
+        is_valid, errors = self._validation
+        return (is_valid, list(errors))
+    
+    @cached_property
+    def _validation(self) -> tuple[bool, tuple[str, ...]]:
+        """Run the configuration checks (cached; see validate())."""
         errors = []
         
         # Validate output directory is writable
@@ -112,7 +167,7 @@ class ReportingConfig:
         if self.font_size < 8 or self.font_size > 14:
             errors.append(f"font_size must be between 8 and 14 (got {self.font_size})")
         
-        return (len(errors) == 0, errors)
+        return (len(errors) == 0, tuple(errors))
     
     def __repr__(self) -> str:
         """String representation of configuration."""
@@ -123,3 +178,17 @@ class ReportingConfig:
             f"timeout={self.generation_timeout}s, "
             f"max_memory={self.max_memory_mb}MB)"
         )
+
+
+@lru_cache(maxsize=1)
+def get_reporting_config(config_path: Optional[Path] = None) -> ReportingConfig:
+    """
+    Return the process-wide ReportingConfig.
+    
+    Args:
+        config_path: Optional path to config file (defaults to conf/local.yml)
+        
+    Returns:
+        Shared ReportingConfig instance
+    """
+    return ReportingConfig(config_path)
@@ -7,17 +7,108 @@ with SIEM detection events. Provides detection coverage metrics for PDF reports.
 Reuses authentication pattern from orchestrator plugin config.
 """
 
+import copy
+import hashlib
 import logging
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+import time
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
 
 try:
     from elasticsearch import AsyncElasticsearch
     from elasticsearch.exceptions import ConnectionError, TransportError
+    from elasticsearch.serializer import JsonSerializer, SerializationError
 except ImportError:
     AsyncElasticsearch = None
     ConnectionError = Exception
     TransportError = Exception
+    JsonSerializer = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if JsonSerializer and orjson:
+    class _OrjsonSerializer(JsonSerializer):
+        """JSON serializer for the ELK client backed by orjson (C-accelerated encode/decode)."""
+        
+        def loads(self, data: bytes) -> Any:
+            if data == b'':
+                return None
+            try:
+                return orjson.loads(data)
+            except ValueError as e:
+                raise SerializationError(f'Unable to deserialize as JSON: {data[:100]!r}', (e,))
+        
+        def dumps(self, data: Any) -> bytes:
+            if isinstance(data, str):
+                return data.encode('utf-8', 'surrogatepass')
+            if isinstance(data, bytes):
+                return data
+            try:
+                return orjson.dumps(data, default=self.default)
+            except TypeError as e:
+                raise SerializationError(f'Unable to serialize to JSON: {data!r}', (e,))
+else:
+    _OrjsonSerializer = None
+
+
+# Clients shared by every ELKFetcher, keyed by a hash of their constructor
+# kwargs so reports reuse keep-alive connections instead of paying a new TLS
+# handshake each time
+_SHARED_CLIENTS: Dict[str, 'AsyncElasticsearch'] = {}
+
+
+def _client_key(client_kwargs: Dict[str, Any]) -> str:
+    """
+    Hash every client setting (URL, credentials, TLS, timeouts) into a registry key.
+    
+    Serializers are compared by class, since each fetcher builds its own instance.
+    
+    Args:
+        client_kwargs: AsyncElasticsearch constructor kwargs
+        
+    Returns:
+        Hex digest identifying these settings (credentials never stored in clear)
+    """
+    settings = []
+    for name, value in sorted(client_kwargs.items()):
+        if name == 'serializers':
+            value = {mimetype: type(serializer).__qualname__ for mimetype, serializer in value.items()}
+        settings.append((name, value))
+    return hashlib.sha256(repr(settings).encode()).hexdigest()
+
+
+def _get_shared_client(client_kwargs: Dict[str, Any]) -> 'AsyncElasticsearch':
+    """
+    Return the shared AsyncElasticsearch client for these settings, creating it once.
+    
+    Args:
+        client_kwargs: AsyncElasticsearch constructor kwargs
+        
+    Returns:
+        Shared AsyncElasticsearch client
+    """
+    key = _client_key(client_kwargs)
+    
+    client = _SHARED_CLIENTS.get(key)
+    if client is None:
+        client = AsyncElasticsearch(**client_kwargs)
+        _SHARED_CLIENTS[key] = client
+    return client
+
+
+@lru_cache(maxsize=1)
+def _iso_second(epoch_second: int) -> str:
+    """Format a UTC epoch second as ISO-8601 with a Z suffix (memoized per second)."""
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(epoch_second))
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time as ISO-8601, at one-second resolution."""
+    return _iso_second(int(time.time()))
 
 
 class ELKFetcher:
@@ -31,6 +122,29 @@ class ELKFetcher:
     - Detection status aggregation (detected/evaded/pending)
     """
     
+    # Indices searched for operation correlation
+    DETECTION_INDEX = 'purple-team-logs-*,auditbeat-*'
+    
+    # Response fields read by _parse_detection_response (ELK strips everything else)
+    DETECTION_FILTER_PATH = [
+        'hits.total.value',
+        'aggregations.by_technique.buckets.key',
+        'aggregations.by_technique.buckets.doc_count',
+        'aggregations.by_technique.buckets.detection_status.buckets.key',
+        'aggregations.by_status.buckets.key',
+        'aggregations.by_status.buckets.doc_count',
+    ]
+    
+    # Seconds a parsed detection result is reused for the same operation
+    # (covers a manual regeneration shortly after the completion-event report)
+    CACHE_TTL_SECONDS = 600
+    
+    # Operations kept in the detection cache (least recently used evicted)
+    CACHE_MAX_ENTRIES = 128
+    
+    # Upper bound on technique buckets per detection query
+    MAX_TECHNIQUE_BUCKETS = 500
+    
     def __init__(self, config, logger: Optional[logging.Logger] = None):
         """
         Initialize ELK fetcher with configuration.
@@ -46,12 +160,17 @@ class ELKFetcher:
         # Track connection state
         self._connected = False
         self._last_error = None
+        
+        # Parsed detection results: (operation_id, bucket size) -> (monotonic
+        # timestamp, data), kept in least- to most-recently-used order
+        self._detection_cache: Dict[Tuple[str, int], Tuple[float, Dict[str, Any]]] = {}
     
     def _init_elk_client(self) -> Optional[AsyncElasticsearch]:
         """
         Initialize async Elasticsearch client.
         
-        Reuses orchestrator's ELK configuration if available.
+        Reuses orchestrator's ELK configuration if available. The client is
+        shared across fetchers with the same URL and credentials.
         
         Returns:
             AsyncElasticsearch client or None if unavailable
@@ -99,7 +218,11 @@ class ELKFetcher:
             elif elk_user and elk_pass:
                 client_kwargs['basic_auth'] = (elk_user, elk_pass)
             
-            client = AsyncElasticsearch(**client_kwargs)
+            # orjson for request/response bodies (also covers the compatibility mimetype)
+            if _OrjsonSerializer:
+                client_kwargs['serializers'] = {'application/json': _OrjsonSerializer()}
+            
+            client = _get_shared_client(client_kwargs)
             self.log.info(f'ELK client initialized for reporting: {elk_url}')
             return client
         
@@ -108,7 +231,8 @@ class ELKFetcher:
             self._last_error = str(e)
             return None
     
-    async def get_detection_data(self, operation_id: str) -> Dict[str, Any]:
+    async def get_detection_data(self, operation_id: str,
+                                 max_techniques: Optional[int] = None) -> Dict[str, Any]:
         """
         Fetch detection data for a Caldera operation.
         
@@ -117,6 +241,8 @@ class ELKFetcher:
         
         Args:
             operation_id: Caldera operation UUID
+            max_techniques: Expected technique count (e.g., chain length), used to
+                size the technique aggregation. Defaults to MAX_TECHNIQUE_BUCKETS.
             
         Returns:
             Dict with detection metrics:
@@ -138,29 +264,34 @@ class ELKFetcher:
         if not self.elk_client:
             return self._empty_detection_data('ELK client not available')
         
+        # Size the technique aggregation to what the caller can actually use
+        bucket_size = max(1, min(self.MAX_TECHNIQUE_BUCKETS, max_techniques or self.MAX_TECHNIQUE_BUCKETS))
+        
+        # Results are cached per bucket size: a capped result must not be
+        # served to a caller that asked for more techniques
+        cache_key = (operation_id, bucket_size)
+        cached = self._detection_cache.pop(cache_key, None)
+        if cached and time.monotonic() - cached[0] < self.CACHE_TTL_SECONDS:
+            self._detection_cache[cache_key] = cached  # Re-insert as most recently used
+            return copy.deepcopy(cached[1])
+        
         try:
             # Query purple-team-logs-* for this operation
-            query = {
-                'bool': {
-                    'should': [
-                        {'term': {'purple.operation_id': operation_id}},
-                        {'term': {'operation_id': operation_id}},
-                        {'match': {'tags': f'purple_{operation_id[:8]}'}}
-                    ],
-                    'minimum_should_match': 1
-                }
-            }
+            query = self._operation_query(operation_id)
             
             # Search with aggregations
             response = await self.elk_client.search(
-                index='purple-team-logs-*,auditbeat-*',
+                index=self.DETECTION_INDEX,
                 query=query,
-                size=100,
+                size=0,  # Only aggregations are parsed; skip hit bodies
+                filter_path=self.DETECTION_FILTER_PATH,
                 aggs={
                     'by_technique': {
                         'terms': {
                             'field': 'purple.technique',
-                            'size': 500
+                            'size': bucket_size,
+                            'shard_size': bucket_size * 2,
+                            'execution_hint': 'map'  # Hash map beats global ordinals at low cardinality
                         },
                         'aggs': {
                             'detection_status': {
@@ -181,7 +312,9 @@ class ELKFetcher:
             )
             
             self._connected = True
-            return self._parse_detection_response(response)
+            detection_data = self._parse_detection_response(response)
+            self._cache_detection_data(cache_key, detection_data)
+            return copy.deepcopy(detection_data)  # Callers never share the cached dict
         
         except (ConnectionError, TransportError) as e:
             self.log.warning(f'ELK connection failed: {e}')
@@ -194,6 +327,27 @@ class ELKFetcher:
             self._last_error = str(e)
             return self._empty_detection_data(f'Query failed: {str(e)[:100]}')
     
+    def _operation_query(self, operation_id: str) -> Dict[str, Any]:
+        """
+        Build the bool query matching ELK documents for one operation.
+        
+        Args:
+            operation_id: Caldera operation UUID
+            
+        Returns:
+            Elasticsearch query dict
+        """
+        return {
+            'bool': {
+                'should': [
+                    {'term': {'purple.operation_id': operation_id}},
+                    {'term': {'operation_id': operation_id}},
+                    {'match': {'tags': f'purple_{operation_id[:8]}'}}
+                ],
+                'minimum_should_match': 1
+            }
+        }
+    
     def _parse_detection_response(self, response: Dict) -> Dict[str, Any]:
         """
         Parse Elasticsearch response into detection metrics.
@@ -209,8 +363,9 @@ class ELKFetcher:
         
         techniques = {}
         summary = {'detected': 0, 'evaded': 0, 'pending': 0}
+        detected_count = 0
         
-        # Parse technique aggregations
+        # Parse technique aggregations (coverage is counted in the same pass)
         aggs = response.get('aggregations', {})
         by_technique = aggs.get('by_technique', {}).get('buckets', [])
         
@@ -233,6 +388,8 @@ class ELKFetcher:
                 'status': status,
                 'count': bucket.get('doc_count', 0)
             }
+            if status == 'detected':
+                detected_count += 1
         
         # Parse overall status summary
         by_status = aggs.get('by_status', {}).get('buckets', [])
@@ -245,7 +402,6 @@ class ELKFetcher:
         # Calculate coverage percentage
         total_techniques = len(techniques)
         if total_techniques > 0:
-            detected_count = sum(1 for t in techniques.values() if t['status'] == 'detected')
             summary['coverage_percent'] = round((detected_count / total_techniques) * 100, 1)
         else:
             summary['coverage_percent'] = 0.0
@@ -255,9 +411,23 @@ class ELKFetcher:
             'total_events': total_events,
             'techniques': techniques,
             'summary': summary,
-            'queried_at': datetime.utcnow().isoformat() + 'Z'
+            'queried_at': _utc_now_iso()
         }
     
+    def _cache_detection_data(self, cache_key: Tuple[str, int], detection_data: Dict[str, Any]) -> None:
+        """
+        Store a parsed detection result, evicting the least recently used entry when full.
+        
+        Args:
+            cache_key: (Caldera operation ID, technique bucket size)
+            detection_data: Parsed detection data
+        """
+        cache = self._detection_cache
+        cache.pop(cache_key, None)
+        cache[cache_key] = (time.monotonic(), detection_data)
+        if len(cache) > self.CACHE_MAX_ENTRIES:
+            del cache[next(iter(cache))]
+    
     def _empty_detection_data(self, reason: str) -> Dict[str, Any]:
         """
         Return empty detection data structure when ELK unavailable.
@@ -312,7 +482,19 @@ class ELKFetcher:
             }
     
     async def close(self):
-        """Close ELK client connection."""
-        if self.elk_client:
-            await self.elk_client.close()
-            self.log.info('ELK client closed')
+        """
+        Release this fetcher's cached state.
+        
+        The ELK client is shared across fetchers and stays open; use
+        shutdown_shared() to close it.
+        """
+        self._detection_cache.clear()
+        self.elk_client = None
+    
+    @staticmethod
+    async def shutdown_shared():
+        """Close every shared ELK client (plugin shutdown and test teardown)."""
+        clients = list(_SHARED_CLIENTS.values())
+        _SHARED_CLIENTS.clear()
+        for client in clients:
+            await client.close()
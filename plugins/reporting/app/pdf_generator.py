@@ -8,20 +8,27 @@ Optimized for low memory usage and async execution.
 
 import asyncio
 import gc
+import heapq
+import io
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from types import SimpleNamespace
+from typing import List, Optional
 from collections import Counter
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4, legal
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
 from reportlab.lib.units import inch
+from reportlab.lib.utils import ImageReader
 from reportlab.platypus import (
-    SimpleDocTemplate, Table, TableStyle, Paragraph,
-    Spacer, PageBreak, Image
+    SimpleDocTemplate, Table, LongTable, TableStyle, Paragraph,
+    Spacer, PageBreak, Image, Flowable, KeepTogether
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 
@@ -30,6 +37,95 @@ from plugins.reporting.app.config import ReportingConfig
 
 logger = logging.getLogger(__name__)
 
+# Link status code -> technique table label
+_STATUS_LABELS = {
+    0: '✓ Success',
+    1: '✗ Failed',
+    -2: '⏱ Timeout'
+}
+
+_TECHNIQUE_TABLE_HEADER = ('ID', 'Name', 'Tactic', 'Status')
+
+# Detection status sort rank and technique table label
+_DETECTION_RANK = {'detected': 0, 'evaded': 1, 'pending': 2}
+_DETECTION_LABELS = {
+    'detected': '✓ Detected',
+    'evaded': '✗ Evaded',
+    'pending': '⏳ Pending'
+}
+
+# Thread pool shared by every PDFGenerator created without an executor, so
+# standalone generators don't each start their own worker threads
+_SHARED_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_SHARED_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_shared_executor(max_workers: int) -> ThreadPoolExecutor:
+    """
+    Return the shared render pool, creating it on first use.
+    
+    Args:
+        max_workers: Pool size if the pool has to be created
+        
+    Returns:
+        The process-wide ThreadPoolExecutor
+    """
+    global _SHARED_EXECUTOR
+    with _SHARED_EXECUTOR_LOCK:
+        if _SHARED_EXECUTOR is None:
+            _SHARED_EXECUTOR = ThreadPoolExecutor(max_workers=max_workers)
+        return _SHARED_EXECUTOR
+
+
+# Set once this process has collected and frozen its heap (see _freeze_heap_once)
+_HEAP_FROZEN = False
+_HEAP_FROZEN_LOCK = threading.Lock()
+
+
+def _freeze_heap_once() -> None:
+    """
+    Collect garbage, then move the surviving heap into the permanent generation.
+    
+    Runs at most once per process: long-lived objects (styles, config, loaded
+    modules) leave the collector's generations so later scans skip them, and
+    the collect first keeps pending cyclic garbage from being frozen forever.
+    """
+    global _HEAP_FROZEN
+    with _HEAP_FROZEN_LOCK:
+        if _HEAP_FROZEN:
+            return
+        gc.collect()
+        gc.freeze()
+        _HEAP_FROZEN = True
+
+
+class _PlainText(Flowable):
+    """
+    One line of plain text drawn straight onto the canvas.
+    
+    Used for fixed one-liners (section titles, footer) so they skip
+    Paragraph's markup parsing and line wrapping. Font, color, leading and
+    spacing come from a ParagraphStyle so it lays out like a Paragraph.
+    """
+    
+    def __init__(self, text: str, style: ParagraphStyle):
+        super().__init__()
+        self.text = text
+        self.style = style
+        self.spaceBefore = style.spaceBefore
+        self.spaceAfter = style.spaceAfter
+    
+    def wrap(self, availWidth, availHeight):
+        self.width = availWidth
+        self.height = self.style.leading
+        return self.width, self.height
+    
+    def draw(self):
+        style = self.style
+        self.canv.setFont(style.fontName, style.fontSize)
+        self.canv.setFillColor(style.textColor)
+        self.canv.drawString(0, self.height - style.fontSize, self.text)
+
 
 class PDFGenerator:
     """
@@ -37,11 +133,21 @@ class PDFGenerator:
     
     Features:
     - Memory-optimized rendering (<100MB overhead)
-    - ThreadPoolExecutor for CPU-bound PDF generation
+    - ThreadPoolExecutor for CPU-bound PDF generation (or a ProcessPoolExecutor
+      with use_processes, so concurrent reports render in parallel)
     - Timeout protection via asyncio.wait_for
     - Graceful degradation on errors
     """
     
+    # Reports generated between full garbage collections
+    GC_INTERVAL_REPORTS = 20
+    
+    # Technique table rows per Table flowable (about a page and a half)
+    TECHNIQUE_TABLE_CHUNK_ROWS = 50
+    
+    # Tables with more rows than this use LongTable (cheaper page splitting)
+    LONG_TABLE_MIN_ROWS = 40
+    
     # MITRE ATT&CK tactic ordering
     TACTIC_ORDER = [
         'reconnaissance', 'resource-development', 'initial-access',
@@ -51,50 +157,247 @@ class PDFGenerator:
         'exfiltration', 'impact'
     ]
     
-    def __init__(self, config: ReportingConfig):
+    # Sort key for tactic rows; tactics outside the kill chain sort last
+    TACTIC_RANK = {tactic: rank for rank, tactic in enumerate(TACTIC_ORDER)}
+    
+    # Stylesheets by branding (colors, body font size), shared by every
+    # generator in the process; styles are only read while rendering
+    _stylesheets = {}
+    _stylesheets_lock = threading.Lock()
+    
+    def __init__(self, config: ReportingConfig, executor: Optional[Executor] = None):
         """
         Initialize PDF generator.
         
         Args:
             config: ReportingConfig instance
+            executor: Optional pool to render in (e.g. ReportService's); a
+                ProcessPoolExecutor selects process mode. If omitted, a process
+                pool is created from config, or the shared thread pool is used.
         """
         self.config = config
-        self.executor = ThreadPoolExecutor(max_workers=config.max_workers)
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
+        
+        if executor is None:
+            # Layout is CPU-bound under the GIL; processes let reports render in parallel
+            if config.use_processes:
+                executor = ProcessPoolExecutor(
+                    max_workers=config.max_workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            else:
+                executor = _get_shared_executor(config.max_workers)
+        self.executor = executor
+        self._use_processes = isinstance(executor, ProcessPoolExecutor)
+        
+        self._setup_rendering()
+        _freeze_heap_once()
+    
+    @classmethod
+    def _for_worker(cls, config: ReportingConfig) -> 'PDFGenerator':
+        """
+        Create a render-only generator (no executor) inside a process worker.
+        
+        Args:
+            config: ReportingConfig instance
+            
+        Returns:
+            PDFGenerator whose _generate_pdf_sync can be called directly
+        """
+        generator = cls.__new__(cls)
+        generator.config = config
+        generator._use_processes = False
+        generator.executor = None
+        generator._setup_rendering()
+        _freeze_heap_once()
+        return generator
+    
+    def _setup_rendering(self) -> None:
+        """Parse brand colors and build paragraph/table styles (fixed per config)."""
+        self._primary_color = colors.HexColor(self.config.primary_color)
+        self._accent_color = colors.HexColor(self.config.accent_color)
+        self._text_color = colors.HexColor(self.config.text_color)
+        
+        self.styles = self._get_styles()
+        self._setup_table_styles()
+        self._logo_bytes = self._load_logo()
+        self._doc_options = self._build_doc_options()
+        self._reports_since_gc = 0
     
-    def _setup_custom_styles(self) -> None:
+    def _build_doc_options(self) -> dict:
+        """
+        Resolve the SimpleDocTemplate arguments shared by every report.
+        
+        Returns:
+            Keyword arguments for SimpleDocTemplate (everything but the filename)
+        """
+        page_sizes = {
+            'LETTER': letter,
+            'A4': A4,
+            'LEGAL': legal
+        }
+        return {
+            'pagesize': page_sizes.get(self.config.page_size, letter),
+            'rightMargin': 0.75 * inch,
+            'leftMargin': 0.75 * inch,
+            'topMargin': 0.75 * inch,
+            'bottomMargin': 0.75 * inch,
+            'allowSplitting': 1,
+            '_pageBreakQuick': 1,
+            # pdf_compress=False is the fast preview mode (uncompressed streams)
+            'pageCompression': 1 if self.config.pdf_compress else 0,
+        }
+    
+    def _load_logo(self) -> Optional[bytes]:
+        """
+        Read and validate the logo once so headers don't reopen it per report.
+        
+        Returns:
+            Raw image bytes, or None if the logo is missing or unreadable
+        """
+        if not self.config.logo_path.exists():
+            return None
+        try:
+            logo_bytes = self.config.logo_path.read_bytes()
+            ImageReader(io.BytesIO(logo_bytes)).getSize()
+            return logo_bytes
+        except Exception as e:
+            logger.warning(f"Failed to load logo: {e}")
+            return None
+    
+    def _get_styles(self) -> StyleSheet1:
+        """
+        Return the paragraph stylesheet for this config's branding.
+        
+        getSampleStyleSheet() and the custom styles are built once per
+        branding and reused by later generators (and process workers).
+        """
+        key = (
+            self.config.primary_color, self.config.accent_color,
+            self.config.text_color, self.config.font_size
+        )
+        with self._stylesheets_lock:
+            styles = self._stylesheets.get(key)
+            if styles is None:
+                styles = getSampleStyleSheet()
+                self._setup_custom_styles(styles)
+                self._stylesheets[key] = styles
+        return styles
+    
+    def _setup_custom_styles(self, styles: StyleSheet1) -> None:
         """Setup custom paragraph styles for Triskele branding."""
         # Title style
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='TLTitle',
-            parent=self.styles['Heading1'],
+            parent=styles['Heading1'],
             fontSize=24,
-            textColor=colors.HexColor(self.config.primary_color),
+            textColor=self._primary_color,
             spaceAfter=30,
             alignment=TA_CENTER,
             fontName='Helvetica-Bold'
         ))
         
         # Subtitle style
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='TLSubtitle',
-            parent=self.styles['Heading2'],
+            parent=styles['Heading2'],
             fontSize=14,
-            textColor=colors.HexColor(self.config.accent_color),
+            textColor=self._accent_color,
             spaceAfter=12,
             fontName='Helvetica-Bold'
         ))
         
         # Body text
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='TLBody',
-            parent=self.styles['BodyText'],
+            parent=styles['BodyText'],
             fontSize=self.config.font_size,
-            textColor=colors.HexColor(self.config.text_color),
+            textColor=self._text_color,
             spaceAfter=12
         ))
     
+    def _setup_table_styles(self) -> None:
+        """Build the table styles once (they only depend on config colors)."""
+        # Operation metadata (label column in brand primary color)
+        self._metadata_table_style = TableStyle([
+            ('BACKGROUND', (0, 0), (0, -1), self._primary_color),
+            ('TEXTCOLOR', (0, 0), (0, -1), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+        ])
+        
+        # Executive summary statistics
+        self._stats_table_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), self._accent_color),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+        ])
+        
+        # Technique details
+        self._technique_table_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), self._accent_color),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+            ('TOPPADDING', (0, 0), (-1, -1), 6),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+        ])
+        
+        # Tactic coverage
+        self._tactic_table_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), self._accent_color),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+        ])
+        
+        # Detection status summary (color-coded rows)
+        self._detection_summary_table_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c3e50')),  # Dark header
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+            # Color-code rows based on status
+            ('BACKGROUND', (0, 1), (-1, 1), colors.HexColor('#d5f5e3')),  # Green for detected
+            ('BACKGROUND', (0, 2), (-1, 2), colors.HexColor('#fadbd8')),  # Red for evaded
+            ('BACKGROUND', (0, 3), (-1, 3), colors.HexColor('#fef9e7')),  # Yellow for pending
+        ])
+        
+        # Per-technique detection status
+        self._detection_technique_table_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), self._accent_color),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+            ('TOPPADDING', (0, 0), (-1, -1), 6),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+        ])
+    
     def _build_header(self, operation) -> list:
         """
         Build report header with logo and title.
@@ -107,10 +410,10 @@ class PDFGenerator:
         """
         elements = []
         
-        # Add logo if exists
-        if self.config.logo_path.exists():
+        # Add logo if one was loaded
+        if self._logo_bytes is not None:
             try:
-                logo = Image(str(self.config.logo_path), width=120, height=40)
+                logo = Image(io.BytesIO(self._logo_bytes), width=120, height=40)
                 elements.append(logo)
                 elements.append(Spacer(1, 0.2 * inch))
             except Exception as e:
@@ -136,19 +439,29 @@ class PDFGenerator:
         Returns:
             ReportLab Table object
         """
+        start = operation.start
+        finish = operation.finish
+        start_str = str(start) if start else None
+        finish_str = str(finish) if finish else None
+        
         duration = 'N/A'
-        if operation.start and operation.finish:
-            start = datetime.fromisoformat(str(operation.start))
-            finish = datetime.fromisoformat(str(operation.finish))
-            duration_delta = finish - start
-            duration = str(duration_delta).split('.')[0]  # Remove microseconds
+        if start_str and finish_str:
+            # Caldera stores datetimes; only parse when given a string
+            if not isinstance(start, datetime):
+                start = datetime.fromisoformat(start_str)
+            if not isinstance(finish, datetime):
+                finish = datetime.fromisoformat(finish_str)
+            total_seconds = int((finish - start).total_seconds())  # Drop microseconds
+            hours, remainder = divmod(total_seconds, 3600)
+            minutes, seconds = divmod(remainder, 60)
+            duration = f"{hours}:{minutes:02d}:{seconds:02d}"
         
         data = [
             ['Operation ID:', operation.id],
             ['Group:', operation.group],
             ['State:', operation.state],
-            ['Start Time:', str(operation.start)[:19] if operation.start else 'N/A'],
-            ['End Time:', str(operation.finish)[:19] if operation.finish else 'N/A'],
+            ['Start Time:', start_str[:19] if start_str else 'N/A'],
+            ['End Time:', finish_str[:19] if finish_str else 'N/A'],
             ['Duration:', duration],
             ['Adversary:', getattr(operation.adversary, 'name', 'N/A')],
             ['Planner:', getattr(operation.planner, 'name', 'N/A')],
@@ -156,25 +469,84 @@ class PDFGenerator:
         ]
         
         table = Table(data, colWidths=[2 * inch, 4 * inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor(self.config.primary_color)),
-            ('TEXTCOLOR', (0, 0), (0, -1), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-        ]))
+        table.setStyle(self._metadata_table_style)
         
         return table
     
-    def _build_executive_summary(self, operation) -> list:
+    def _summarize_chain(self, operation) -> dict:
+        """
+        Walk the operation chain once and collect what the section builders need.
+        
+        Args:
+            operation: Caldera operation object
+            
+        Returns:
+            Dict with 'total' (link count), 'status_counts' and 'tactic_counts'
+            (Counters), and 'rows' (technique table row tuples, one per link)
+        """
+        statuses = []
+        tactics = []
+        rows = []
+        
+        g = getattr
+        append_status = statuses.append
+        append_tactic = tactics.append
+        append_row = rows.append
+        for link in operation.chain or ():
+            ability = link.ability
+            status = link.status
+            tactic = g(ability, 'tactic', None)
+            
+            append_status(status)
+            append_tactic(tactic)
+            append_row((
+                g(ability, 'technique_id', 'N/A'),
+                (g(ability, 'technique_name', None) or g(ability, 'name', 'N/A'))[:30],
+                tactic if tactic is not None else 'N/A',
+                _STATUS_LABELS.get(status, 'Unknown')
+            ))
+        
+        # Counter() over an iterable tallies in C rather than one += per link
+        return {
+            'total': len(rows),
+            'status_counts': Counter(statuses),
+            'tactic_counts': Counter(filter(None, tactics)),
+            'rows': rows
+        }
+    
+    def _operation_snapshot(self, operation) -> SimpleNamespace:
+        """
+        Copy the operation fields the report reads into a picklable object.
+        
+        Caldera operations hold service references and can't be sent to a
+        process worker; the chain is sent separately as _summarize_chain() output.
+        
+        Args:
+            operation: Caldera operation object
+            
+        Returns:
+            Lightweight operation stand-in (chain omitted)
+        """
+        return SimpleNamespace(
+            id=operation.id,
+            name=operation.name,
+            group=operation.group,
+            state=operation.state,
+            start=operation.start,
+            finish=operation.finish,
+            adversary=SimpleNamespace(name=getattr(operation.adversary, 'name', 'N/A')),
+            planner=SimpleNamespace(name=getattr(operation.planner, 'name', 'N/A')),
+            jitter=getattr(operation, 'jitter', 'N/A'),
+            chain=None
+        )
+    
+    def _build_executive_summary(self, operation, chain_summary: Optional[dict] = None) -> list:
         """
         Build executive summary section.
         
         Args:
             operation: Caldera operation object
+            chain_summary: Optional result of _summarize_chain() (computed if omitted)
             
         Returns:
             List of flowables
@@ -182,11 +554,14 @@ class PDFGenerator:
         elements = []
         
         # Section title
-        elements.append(Paragraph("Executive Summary", self.styles['TLSubtitle']))
+        elements.append(_PlainText("Executive Summary", self.styles['TLSubtitle']))
         elements.append(Spacer(1, 0.1 * inch))
         
+        if chain_summary is None:
+            chain_summary = self._summarize_chain(operation)
+        
         # Calculate statistics
-        total_techniques = len(operation.chain) if operation.chain else 0
+        total_techniques = chain_summary['total']
         
         # Avoid division by zero
         if total_techniques == 0:
@@ -194,20 +569,27 @@ class PDFGenerator:
             failure_rate = 0
             timeout_rate = 0
         else:
-            successful = sum(1 for link in operation.chain if link.status == 0)
-            failed = sum(1 for link in operation.chain if link.status == 1)
-            timeout = sum(1 for link in operation.chain if link.status == -2)
-            
-            success_rate = (successful / total_techniques) * 100
-            failure_rate = (failed / total_techniques) * 100
-            timeout_rate = (timeout / total_techniques) * 100
+            status_counts = chain_summary['status_counts']
+            successful = status_counts.get(0, 0)
+            failed = status_counts.get(1, 0)
+            timeout = status_counts.get(-2, 0)
+
+            percent_per_link = 100.0 / total_techniques
+            success_rate = successful * percent_per_link
+            failure_rate = failed * percent_per_link
+            timeout_rate = timeout * percent_per_link
+        
+        # Each rate appears in both the text and the table; format it once
+        success_pct = f"{success_rate:.1f}%"
+        failure_pct = f"{failure_rate:.1f}%"
+        timeout_pct = f"{timeout_rate:.1f}%"
         
         # Summary text
         summary_text = f"""
         This purple team exercise executed <b>{total_techniques}</b> techniques 
         against the <b>{operation.group}</b> environment. The operation achieved 
-        a <b>{success_rate:.1f}%</b> success rate, with <b>{failure_rate:.1f}%</b> 
-        failures and <b>{timeout_rate:.1f}%</b> timeouts.
+        a <b>{success_pct}</b> success rate, with <b>{failure_pct}</b> 
+        failures and <b>{timeout_pct}</b> timeouts.
         """
         
         elements.append(Paragraph(summary_text, self.styles['TLBody']))
@@ -217,144 +599,101 @@ class PDFGenerator:
         stats_data = [
             ['Metric', 'Value'],
             ['Total Techniques', str(total_techniques)],
-            ['Successful', f"{success_rate:.1f}%"],
-            ['Failed', f"{failure_rate:.1f}%"],
-            ['Timed Out', f"{timeout_rate:.1f}%"],
+            ['Successful', success_pct],
+            ['Failed', failure_pct],
+            ['Timed Out', timeout_pct],
         ]
         
         stats_table = Table(stats_data, colWidths=[2.5 * inch, 1.5 * inch])
-        stats_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(self.config.accent_color)),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-        ]))
+        stats_table.setStyle(self._stats_table_style)
         
-        elements.append(stats_table)
-        elements.append(Spacer(1, 0.3 * inch))
+        # Small fixed-size table: keep it whole instead of letting a split near
+        # the page bottom trigger a re-layout
+        elements.append(KeepTogether([stats_table, Spacer(1, 0.3 * inch)]))
         
         return elements
     
-    def _build_technique_table(self, operation) -> list:
+    def _build_technique_table(self, operation, chain_summary: Optional[dict] = None) -> list:
         """
         Build detailed technique execution table.
         
         Args:
             operation: Caldera operation object
+            chain_summary: Optional result of _summarize_chain() (computed if omitted)
             
         Returns:
             List of flowables
         """
         elements = []
         
-        elements.append(Paragraph("Technique Details", self.styles['TLSubtitle']))
+        elements.append(_PlainText("Technique Details", self.styles['TLSubtitle']))
         elements.append(Spacer(1, 0.1 * inch))
         
-        if not operation.chain:
+        if chain_summary is None:
+            chain_summary = self._summarize_chain(operation)
+        
+        if not chain_summary['total']:
             elements.append(Paragraph("No techniques executed.", self.styles['TLBody']))
             return elements
         
-        # Build table data
-        data = [['ID', 'Name', 'Tactic', 'Status']]
-        
-        for link in operation.chain:
-            technique_id = getattr(link.ability, 'technique_id', 'N/A')
-            technique_name = getattr(link.ability, 'technique_name', 
-                                    getattr(link.ability, 'name', 'N/A'))
-            tactic = getattr(link.ability, 'tactic', 'N/A')
-            
-            # Status mapping
-            status_map = {
-                0: '✓ Success',
-                1: '✗ Failed',
-                -2: '⏱ Timeout'
-            }
-            status = status_map.get(link.status, 'Unknown')
-            
-            data.append([technique_id, technique_name[:30], tactic, status])
+        # Emit fixed-size tables (header repeated) so long chains are laid out
+        # and split in bounded pieces instead of one table re-split per page
+        rows = chain_summary['rows']
+        chunk_rows = self.TECHNIQUE_TABLE_CHUNK_ROWS
+        for start in range(0, len(rows), chunk_rows):
+            data = [_TECHNIQUE_TABLE_HEADER, *rows[start:start + chunk_rows]]
+            table_cls = LongTable if len(data) > self.LONG_TABLE_MIN_ROWS else Table
+            table = table_cls(data,
+                              colWidths=[1 * inch, 2.5 * inch, 1.5 * inch, 1 * inch],
+                              repeatRows=1)
+            table.setStyle(self._technique_table_style)
+            elements.append(table)
         
-        # Create table
-        table = Table(data, colWidths=[1 * inch, 2.5 * inch, 1.5 * inch, 1 * inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(self.config.accent_color)),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-        ]))
-        
-        elements.append(table)
         elements.append(Spacer(1, 0.3 * inch))
         
         return elements
     
-    def _build_tactic_coverage(self, operation) -> list:
+    def _build_tactic_coverage(self, operation, chain_summary: Optional[dict] = None) -> list:
         """
         Build MITRE ATT&CK tactic coverage analysis.
         
         Args:
             operation: Caldera operation object
+            chain_summary: Optional result of _summarize_chain() (computed if omitted)
             
         Returns:
             List of flowables
         """
         elements = []
         
-        elements.append(Paragraph("Tactic Coverage", self.styles['TLSubtitle']))
+        elements.append(_PlainText("Tactic Coverage", self.styles['TLSubtitle']))
         elements.append(Spacer(1, 0.1 * inch))
         
-        if not operation.chain:
+        if chain_summary is None:
+            chain_summary = self._summarize_chain(operation)
+        
+        if not chain_summary['total']:
             elements.append(Paragraph("No tactics covered.", self.styles['TLBody']))
             return elements
         
-        # Count tactics
-        tactic_counter = Counter()
-        for link in operation.chain:
-            tactic = getattr(link.ability, 'tactic', None)
-            if tactic:
-                tactic_counter[tactic] += 1
+        tactic_counter = chain_summary['tactic_counts']
         
         # Build table ordered by MITRE ATT&CK kill chain
         data = [['Tactic', 'Count', 'Percentage']]
         
         total = sum(tactic_counter.values())
-        if total == 0:
-            total = 1  # Avoid division by zero
+        percent_per_link = 100.0 / (total or 1)  # Avoid division by zero
         
-        for tactic in self.TACTIC_ORDER:
-            count = tactic_counter.get(tactic, 0)
-            if count > 0:
-                percentage = (count / total) * 100
-                data.append([tactic.title(), str(count), f"{percentage:.1f}%"])
-        
-        # Add any tactics not in standard order
-        for tactic, count in tactic_counter.items():
-            if tactic not in self.TACTIC_ORDER:
-                percentage = (count / total) * 100
-                data.append([tactic.title(), str(count), f"{percentage:.1f}%"])
+        # Unknown tactics keep first-seen order after the standard ones (stable sort)
+        unknown_rank = len(self.TACTIC_ORDER)
+        for tactic, count in sorted(
+            tactic_counter.items(),
+            key=lambda item: self.TACTIC_RANK.get(item[0], unknown_rank)
+        ):
+            data.append([tactic.title(), str(count), f"{count * percent_per_link:.1f}%"])
         
         table = Table(data, colWidths=[2.5 * inch, 1 * inch, 1.5 * inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(self.config.accent_color)),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-        ]))
+        table.setStyle(self._tactic_table_style)
         
         elements.append(table)
         elements.append(Spacer(1, 0.3 * inch))
@@ -376,7 +715,7 @@ class PDFGenerator:
         """
         elements = []
         
-        elements.append(Paragraph("Detection Coverage", self.styles['TLSubtitle']))
+        elements.append(_PlainText("Detection Coverage", self.styles['TLSubtitle']))
         elements.append(Spacer(1, 0.1 * inch))
         
         # Check if data available
@@ -408,56 +747,41 @@ class PDFGenerator:
         elements.append(Spacer(1, 0.15 * inch))
         
         # Detection summary table
+        percent_per_technique = 100.0 / max(total_techniques, 1)
         summary_data = [
             ['Detection Status', 'Count', 'Percentage'],
-            ['✓ Detected', str(detected), f"{(detected / max(total_techniques, 1)) * 100:.1f}%"],
-            ['✗ Evaded', str(evaded), f"{(evaded / max(total_techniques, 1)) * 100:.1f}%"],
-            ['⏳ Pending', str(pending), f"{(pending / max(total_techniques, 1)) * 100:.1f}%"],
+            ['✓ Detected', str(detected), f"{detected * percent_per_technique:.1f}%"],
+            ['✗ Evaded', str(evaded), f"{evaded * percent_per_technique:.1f}%"],
+            ['⏳ Pending', str(pending), f"{pending * percent_per_technique:.1f}%"],
         ]
         
         summary_table = Table(summary_data, colWidths=[2 * inch, 1 * inch, 1.5 * inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c3e50')),  # Dark header
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-            # Color-code rows based on status
-            ('BACKGROUND', (0, 1), (-1, 1), colors.HexColor('#d5f5e3')),  # Green for detected
-            ('BACKGROUND', (0, 2), (-1, 2), colors.HexColor('#fadbd8')),  # Red for evaded
-            ('BACKGROUND', (0, 3), (-1, 3), colors.HexColor('#fef9e7')),  # Yellow for pending
-        ]))
+        summary_table.setStyle(self._detection_summary_table_style)
         
         elements.append(summary_table)
         elements.append(Spacer(1, 0.2 * inch))
         
         # Per-technique detection status (if we have technique-level data)
         if techniques:
-            elements.append(Paragraph("Technique Detection Status", self.styles['TLSubtitle']))
+            elements.append(_PlainText("Technique Detection Status", self.styles['TLSubtitle']))
             elements.append(Spacer(1, 0.1 * inch))
             
             tech_data = [['Technique ID', 'Detection Status', 'Event Count']]
             
-            # Sort by status (detected first, then evaded, then pending)
-            status_order = {'detected': 0, 'evaded': 1, 'pending': 2}
-            sorted_techniques = sorted(
-                techniques.items(),
-                key=lambda x: (status_order.get(x[1].get('status', 'pending'), 3), x[0])
-            )
+            # Sort by status (detected first, then evaded, then pending), then ID.
+            # Keys are computed once into plain tuples (IDs are unique, so info
+            # dicts are never compared) and only the 30 shown rows are selected
+            keyed = [
+                (_DETECTION_RANK.get(tech_info.get('status', 'pending'), 3), tech_id, tech_info)
+                for tech_id, tech_info in techniques.items()
+            ]
             
-            for tech_id, tech_info in sorted_techniques[:30]:  # Limit to 30 techniques
+            for _, tech_id, tech_info in heapq.nsmallest(30, keyed):  # Limit to 30 techniques
                 status = tech_info.get('status', 'pending')
                 count = tech_info.get('count', 0)
                 
                 # Status display with emoji
-                status_display = {
-                    'detected': '✓ Detected',
-                    'evaded': '✗ Evaded',
-                    'pending': '⏳ Pending'
-                }.get(status, status)
+                status_display = _DETECTION_LABELS.get(status, status)
                 
                 tech_data.append([tech_id, status_display, str(count)])
             
@@ -465,17 +789,7 @@ class PDFGenerator:
                 tech_data.append(['...', f'+{len(techniques) - 30} more', ''])
             
             tech_table = Table(tech_data, colWidths=[1.5 * inch, 2 * inch, 1.5 * inch])
-            tech_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(self.config.accent_color)),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                ('TOPPADDING', (0, 0), (-1, -1), 6),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-            ]))
+            tech_table.setStyle(self._detection_technique_table_style)
             
             elements.append(tech_table)
         
@@ -483,14 +797,16 @@ class PDFGenerator:
         
         return elements
     
-    def _generate_pdf_sync(self, operation, filename: str, detection_data: Optional[dict] = None) -> Path:
+    def _generate_pdf_sync(self, operation, filename: str, detection_data: Optional[dict] = None,
+                           chain_summary: Optional[dict] = None) -> Path:
         """
-        Synchronous PDF generation (runs in ThreadPoolExecutor).
+        Synchronous PDF generation (runs in the executor).
         
         Args:
             operation: Caldera operation object
             filename: Output filename
             detection_data: Optional ELK detection correlation data
+            chain_summary: Optional result of _summarize_chain() (computed if omitted)
             
         Returns:
             Path to generated PDF
@@ -501,59 +817,64 @@ class PDFGenerator:
         if detection_data is None:
             detection_data = {'available': False, 'reason': 'Not fetched'}
         
-        # Choose page size
-        page_sizes = {
-            'LETTER': letter,
-            'A4': A4,
-            'LEGAL': legal
-        }
-        page_size = page_sizes.get(self.config.page_size, letter)
-        
-        # Create PDF document
-        doc = SimpleDocTemplate(
-            str(output_path),
-            pagesize=page_size,
-            rightMargin=0.75 * inch,
-            leftMargin=0.75 * inch,
-            topMargin=0.75 * inch,
-            bottomMargin=0.75 * inch
-        )
-        
         # Build content
         elements = []
         
+        # Single traversal of the chain shared by the section builders
+        if chain_summary is None:
+            chain_summary = self._summarize_chain(operation)
+        
         # Header
         elements.extend(self._build_header(operation))
         
-        # Metadata table
-        elements.append(self._build_metadata_table(operation))
-        elements.append(Spacer(1, 0.3 * inch))
+        # Metadata table (small, kept whole)
+        elements.append(KeepTogether([self._build_metadata_table(operation), Spacer(1, 0.3 * inch)]))
         
         # Executive summary
         if self.config.include_executive_summary:
-            elements.extend(self._build_executive_summary(operation))
+            elements.extend(self._build_executive_summary(operation, chain_summary))
         
         # Tactic coverage
         if self.config.include_tactic_coverage:
-            elements.extend(self._build_tactic_coverage(operation))
+            elements.extend(self._build_tactic_coverage(operation, chain_summary))
         
         # Detection coverage (from ELK correlation)
         elements.extend(self._build_detection_summary(detection_data))
         
-        # Technique details
+        # Technique details (the large table) start on a fresh page so its
+        # splitting never re-lays out the sections above; a trailing spacer
+        # would only be discarded at the break
         if self.config.include_technique_details:
-            elements.extend(self._build_technique_table(operation))
+            if chain_summary['total']:
+                if isinstance(elements[-1], Spacer):
+                    elements.pop()
+                elements.append(PageBreak())
+            elements.extend(self._build_technique_table(operation, chain_summary))
         
         # Footer
         elements.append(Spacer(1, 0.5 * inch))
         footer_text = f"Generated by {self.config.company_name} | {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        elements.append(Paragraph(footer_text, self.styles['TLBody']))
+        elements.append(_PlainText(footer_text, self.styles['TLBody']))
         
-        # Build PDF
-        doc.build(elements)
+        # Build PDF into a sibling .part file and rename it into place, so a
+        # failed or interrupted build never leaves a truncated report behind
+        # (page size, margins and compression are fixed per config)
+        part_path = output_path.with_suffix(output_path.suffix + '.part')
+        try:
+            with open(part_path, 'wb') as fh:
+                doc = SimpleDocTemplate(fh, **self._doc_options)
+                doc.build(elements)
+            os.replace(part_path, output_path)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
         
-        # Force garbage collection to free memory
-        gc.collect()
+        # Periodic full collection (reportlab leaves reference cycles behind);
+        # a full scan per report would bill its cost to every report
+        self._reports_since_gc += 1
+        if self._reports_since_gc >= self.GC_INTERVAL_REPORTS:
+            self._reports_since_gc = 0
+            gc.collect()
         
         logger.info(f"PDF generated successfully: {output_path}")
         return output_path
@@ -588,17 +909,21 @@ class PDFGenerator:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"report_{operation.id}_{timestamp}.pdf"
         
+        # Process workers get the config and picklable stand-ins for the operation;
+        # threads call the bound method on the live operation
+        if self._use_processes:
+            render = _render_in_worker
+            args = (self.config, self._operation_snapshot(operation), filename,
+                    detection_data, self._summarize_chain(operation))
+        else:
+            render = self._generate_pdf_sync
+            args = (operation, filename, detection_data)
+        
         try:
-            # Run CPU-bound PDF generation in thread pool with timeout
-            loop = asyncio.get_event_loop()
+            # Run CPU-bound PDF generation in the executor with timeout
+            loop = asyncio.get_running_loop()
             pdf_path = await asyncio.wait_for(
-                loop.run_in_executor(
-                    self.executor,
-                    self._generate_pdf_sync,
-                    operation,
-                    filename,
-                    detection_data
-                ),
+                loop.run_in_executor(self.executor, render, *args),
                 timeout=self.config.generation_timeout
             )
             
@@ -612,9 +937,77 @@ class PDFGenerator:
             logger.exception(f"PDF generation failed for operation {operation.id}: {e}")
             return None
     
+    async def generate_many(self, operations: List) -> List[Optional[Path]]:
+        """
+        Generate reports for several operations concurrently.
+        
+        At most config.max_workers renders are queued on the executor at once;
+        a timed-out operation yields None instead of failing the batch.
+        
+        Args:
+            operations: Caldera operation objects
+            
+        Returns:
+            Paths to generated PDFs (None on error), in input order
+        """
+        slots = asyncio.Semaphore(self.config.max_workers)
+        
+        async def generate_one(operation) -> Optional[Path]:
+            async with slots:
+                try:
+                    return await self.generate(operation)
+                except asyncio.TimeoutError:
+                    return None  # Logged by generate()
+        
+        return list(await asyncio.gather(*(generate_one(operation) for operation in operations)))
+    
     async def shutdown(self) -> None:
-        """Gracefully shutdown the PDF generator."""
+        """
+        Gracefully shutdown the PDF generator.
+        
+        The shared thread pool outlives individual generators; use
+        shutdown_shared() to close it.
+        """
         logger.info("Shutting down PDF generator...")
-        self.executor.shutdown(wait=True)
-        gc.collect()
+        # Joining workers blocks; keep it off the event loop
+        if self.executor is not _SHARED_EXECUTOR:
+            await asyncio.to_thread(self.executor.shutdown, wait=True, cancel_futures=False)
+        await asyncio.to_thread(gc.collect)
         logger.info("PDF generator shutdown complete")
+    
+    @staticmethod
+    async def shutdown_shared() -> None:
+        """Close the shared render pool (plugin shutdown and test teardown)."""
+        global _SHARED_EXECUTOR
+        with _SHARED_EXECUTOR_LOCK:
+            executor, _SHARED_EXECUTOR = _SHARED_EXECUTOR, None
+        if executor is not None:
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=False)
+
+
+# Render-only generator reused by every job in a process worker (styles built once)
+_worker_generator: Optional[PDFGenerator] = None
+
+
+def _render_in_worker(config: ReportingConfig, operation, filename: str,
+                      detection_data: Optional[dict], chain_summary: dict) -> Path:
+    """
+    Process pool entry point for PDF generation.
+    
+    Module-level so it pickles by reference; only the config and the plain
+    operation snapshot/chain summary cross the process boundary.
+    
+    Args:
+        config: ReportingConfig instance
+        operation: Picklable operation snapshot (see PDFGenerator._operation_snapshot)
+        filename: Output filename
+        detection_data: Optional ELK detection correlation data
+        chain_summary: Result of PDFGenerator._summarize_chain()
+        
+    Returns:
+        Path to generated PDF
+    """
+    global _worker_generator
+    if _worker_generator is None:
+        _worker_generator = PDFGenerator._for_worker(config)
+    return _worker_generator._generate_pdf_sync(operation, filename, detection_data, chain_summary)
@@ -2,7 +2,9 @@
 Report Service for Caldera PDF generation plugin.
 
 CRITICAL REQUIREMENTS:
-1. Thread Safety: Singleton ThreadPoolExecutor (max_workers=1) initialized in __init__
+1. Thread Safety: Singleton executor (max_workers from config, capped at the CPU
+   count) initialized in __init__ and shared with PDFGenerator; a spawn
+   ProcessPoolExecutor with use_processes, so renders are not serialized by the GIL
    - Prevents thread leaks from repeated report requests
    - Must be closed in shutdown() with executor.shutdown(wait=True)
 
@@ -13,7 +15,7 @@ CRITICAL REQUIREMENTS:
 
 3. Error Handling:
    - Graceful degradation (log errors, return JSON, don't crash)
-   - Track active reports (self._active_reports set) to prevent duplicates
+   - Track in-flight reports (self._in_flight tasks) so duplicates share one render
 
 4. Caldera Integration:
    - data_svc.locate('operations', {'id': operation_id}) for lookups
@@ -31,16 +33,36 @@ ARCHITECTURE:
 """
 
 import asyncio
+import importlib.util
+import json
 import logging
+import multiprocessing
+import os
+from contextlib import AsyncExitStack
+from functools import partial
+from operator import itemgetter
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor
-from typing import Optional, Dict, Any, Set
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple, TYPE_CHECKING
 from datetime import datetime
 
 from aiohttp import web
 
-from plugins.reporting.app.pdf_generator import PDFGenerator
-from plugins.reporting.app.config import ReportingConfig
+from plugins.reporting.app.config import get_reporting_config
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    from plugins.reporting.app.pdf_generator import PDFGenerator
+
+# ReportLab is only imported when the first report is rendered (see
+# ReportService._ensure_generator); still fail the plugin import here when it is
+# missing so hook.py disables the plugin at startup
+if importlib.util.find_spec('reportlab') is None:
+    raise ModuleNotFoundError("No module named 'reportlab'", name='reportlab')
 
 # Optional ELK integration (graceful fallback if unavailable)
 try:
@@ -56,7 +78,7 @@ class ReportService:
     Service that handles PDF report generation for Caldera operations.
     
     Thread Safety:
-    - Single ThreadPoolExecutor (max_workers=1) initialized in __init__
+    - Single executor initialized in __init__ (shared with PDFGenerator)
     - Prevents thread leaks from repeated report requests
     - Graceful shutdown waits for pending reports
     
@@ -77,9 +99,12 @@ class ReportService:
                 - app_svc: Application service with logger
         
         Thread Pool Strategy:
-            - max_workers=1: Single background thread (PDF rendering is CPU-bound)
+            - max_workers=min(config.max_workers, CPU count): reports for
+              operations finishing together render concurrently
             - Prevents Caldera UI freeze (rendering runs in separate thread)
-            - Queue depth: Unlimited (ThreadPoolExecutor queues excess tasks)
+            - use_processes: spawn ProcessPoolExecutor instead, so renders run
+              on several cores (PDFGenerator sends a picklable snapshot)
+            - Queue depth: bounded by self._render_slots (one slot per worker)
         
         CRITICAL: Executor must be closed in shutdown() to prevent thread leaks!
         """
@@ -101,7 +126,7 @@ class ReportService:
         
         # Initialize configuration
         try:
-            self.config = ReportingConfig()
+            self.config = get_reporting_config()
             is_valid, errors = self.config.validate()
             
             if not is_valid:
@@ -114,9 +139,6 @@ class ReportService:
             self.log.error(f"Failed to load reporting configuration: {e}")
             raise
         
-        # Initialize PDF generator (contains ReportLab logic)
-        self.pdf_generator = PDFGenerator(self.config)
-        
         # Initialize ELK fetcher for detection correlation (optional)
         self.elk_fetcher = None
         if _elk_available and ELKFetcher:
@@ -129,15 +151,66 @@ class ReportService:
             self.log.info('ELK fetcher not available, detection correlation disabled')
         
         # ✅ MARCUS FIX: Single executor initialized once (not per request)
-        self._executor = ThreadPoolExecutor(
-            max_workers=1,  # Single worker (PDF generation is CPU-bound)
-            thread_name_prefix='reporting-pdf-worker'
-        )
+        max_workers = min(self.config.max_workers, os.cpu_count() or 2)
+        if self.config.use_processes:
+            # Render in spawned processes so concurrent reports use several cores
+            self._executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix='reporting-pdf-worker'
+            )
         
-        # Track active reports (prevent duplicate generation)
-        self._active_reports: Set[str] = set()  # Set of operation IDs currently generating
+        # Backpressure: at most one in-flight render per worker; further
+        # requests wait here instead of piling up in the executor queue
+        self._render_slots = asyncio.Semaphore(max_workers)
+        
+        # In-flight generations by operation ID: concurrent requests/events for
+        # the same operation await one shared render instead of starting another
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        
+        # Generated reports by filename (see _report_entry()); loaded from
+        # disk on first use and updated as reports are generated, so list and
+        # download requests don't walk the reports directory
+        self._report_index: Dict[str, Dict[str, Any]] = {}
+        # output_dir's st_mtime_ns as of the last scan (None: not scanned yet);
+        # files added or removed behind our back change it and force a rescan
+        self._report_index_mtime_ns: Optional[int] = None
+        # /list response body, newest first (None: rebuild from the index)
+        self._report_listings: Optional[List[Dict[str, Any]]] = None
+        # Newest entry per operation ID prefix and per normalized operation
+        # name, so downloads are a dict lookup rather than a filename search
+        self._reports_by_op_prefix: Dict[str, Dict[str, Any]] = {}
+        self._reports_by_op_name: Dict[str, Dict[str, Any]] = {}
+        
+        # Created by _ensure_generator() when the first report is rendered
+        self.pdf_generator: Optional['PDFGenerator'] = None
+        self._generator_lock = asyncio.Lock()
+        
+        self.log.info(f'✅ ReportService initialized ({type(self._executor).__name__} ready)')
+    
+    def _create_generator(self) -> 'PDFGenerator':
+        """Import ReportLab and build the generator (blocking; run in a thread)."""
+        from plugins.reporting.app.pdf_generator import PDFGenerator
+        return PDFGenerator(self.config, executor=self._executor)
+    
+    async def _ensure_generator(self) -> 'PDFGenerator':
+        """
+        PDF generator (contains ReportLab logic), created on first use.
         
-        self.log.info('✅ ReportService initialized (ThreadPoolExecutor ready)')
+        Importing ReportLab and building its styles costs memory, so servers
+        that never generate a report don't pay for it. The import runs off the
+        event loop, and the lock keeps concurrent first requests from building
+        two generators.
+        """
+        if self.pdf_generator is None:
+            async with self._generator_lock:
+                if self.pdf_generator is None:
+                    self.pdf_generator = await asyncio.to_thread(self._create_generator)
+        return self.pdf_generator
     
     async def generate_report_api(self, request: web.Request) -> web.Response:
         """
@@ -158,11 +231,15 @@ class ReportService:
             - Logs generation time in milliseconds
             - Target: <8000ms for 30-technique operations
         """
-        start_time = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        operation_id = None  # Referenced by the error handlers if the body is malformed
         
         try:
-            # Parse request body
-            data = await request.json()
+            # Parse request body (tiny {"operation_id": ...} payload; orjson parses
+            # the raw bytes without a text decode when installed)
+            body = await request.read()
+            data = orjson.loads(body) if orjson else json.loads(body)
             operation_id = data.get('operation_id')
             
             if not operation_id:
@@ -175,7 +252,7 @@ class ReportService:
             operations = await self.data_svc.locate('operations', match=dict(id=operation_id))
             
             if not operations:
-                self.log.warning(f"Operation {operation_id} not found")
+                self.log.warning("Operation %s not found", operation_id)
                 return web.json_response(
                     {'success': False, 'error': f'Operation {operation_id} not found'},
                     status=404
@@ -190,73 +267,47 @@ class ReportService:
                     status=400
                 )
             
-            # Check for duplicate request
-            if operation_id in self._active_reports:
-                self.log.warning(f"Report already being generated for operation {operation_id}")
+            generation, started = self._get_or_start_generation(operation_id, operation)
+            if started:
+                self.log.debug("Manual report generation requested for operation %s", operation_id)
+            else:
+                self.log.debug("Report already being generated for operation %s, waiting for it", operation_id)
+            
+            # Shielded: a client disconnect must not cancel a render other callers share
+            result = await asyncio.shield(generation)
+            
+            if not result:
                 return web.json_response(
-                    {'success': False, 'error': 'Report generation already in progress'},
-                    status=409
+                    {'success': False, 'error': 'PDF generation returned None'},
+                    status=500
                 )
             
-            self._active_reports.add(operation_id)
+            pdf_path, report = result
             
-            try:
-                # Fetch detection data from ELK (non-blocking, with fallback)
-                detection_data = None
-                if self.elk_fetcher:
-                    try:
-                        detection_data = await self.elk_fetcher.get_detection_data(operation_id)
-                        self.log.info(f"Detection data fetched: {detection_data.get('summary', {})}")
-                    except Exception as elk_error:
-                        self.log.warning(f"ELK fetch failed (non-fatal): {elk_error}")
-                        detection_data = {'available': False, 'reason': str(elk_error)[:100]}
-                
-                # Generate PDF asynchronously (runs in ThreadPoolExecutor)
-                self.log.info(f"🚀 Manual report generation requested for operation {operation_id}")
-                
-                pdf_path = await self.pdf_generator.generate(operation, detection_data)
-                
-                if not pdf_path:
-                    return web.json_response(
-                        {'success': False, 'error': 'PDF generation returned None'},
-                        status=500
-                    )
-                
-                # Calculate generation time
-                end_time = asyncio.get_event_loop().time()
-                generation_time_ms = int((end_time - start_time) * 1000)
-                
-                self.log.info(
-                    f"✅ Manual report generated: {pdf_path.name} "
-                    f"({pdf_path.stat().st_size / 1024:.1f}KB, {generation_time_ms}ms)"
-                )
-                
-                # Check performance target
-                if generation_time_ms > 8000:
-                    self.log.warning(f"⚠️ Generation time {generation_time_ms}ms exceeded 8s target")
-                else:
-                    self.log.info(f"⚡ Performance: WITHIN TARGET ({generation_time_ms}ms < 8s)")
-                
-                return web.json_response({
-                    'success': True,
-                    'pdf_path': str(pdf_path),
-                    'generation_time_ms': generation_time_ms,
-                    'pdf_size_kb': pdf_path.stat().st_size / 1024
-                })
+            # Calculate generation time (target: 8s)
+            generation_time_ms = int((loop.time() - start_time) * 1000)
+            
+            self._log_report_generated(
+                'api', operation_id, pdf_path, report,
+                generation_ms=generation_time_ms, total_ms=generation_time_ms, target_ms=8000
+            )
             
-            finally:
-                # Always remove from active reports
-                self._active_reports.discard(operation_id)
+            return web.json_response({
+                'success': True,
+                'pdf_path': str(pdf_path),
+                'generation_time_ms': generation_time_ms,
+                'pdf_size_kb': report['size'] / 1024
+            })
         
         except asyncio.TimeoutError:
-            self.log.error(f"PDF generation timed out for operation {operation_id}")
+            self.log.error("PDF generation timed out for operation %s", operation_id)
             return web.json_response(
                 {'success': False, 'error': 'Generation timeout (>30s)'},
                 status=504
             )
         
         except Exception as e:
-            self.log.exception(f"Failed to generate report for {operation_id}: {e}")
+            self.log.exception("Failed to generate report for %s: %s", operation_id, e)
             return web.json_response(
                 {'success': False, 'error': str(e)},
                 status=500
@@ -295,104 +346,97 @@ class ReportService:
             return
         
         # Event latency tracking
-        event_received_time = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        event_received_time = loop.time()
         
         # Fetch operation from data_svc
         if not self.data_svc:
             self.log.error('[reporting] data_svc not available')
             return
         
-        operations = await self.data_svc.locate('operations', match=dict(id=operation_id))
-        
-        if not operations:
-            self.log.warning(f"Operation {operation_id} not found in event handler")
+        # Skip the lookup when the event says the operation isn't finished, or
+        # when an API request or earlier event is already generating the report
+        state = kwargs.get('state')
+        if state not in (None, 'finished'):
+            self.log.debug("Operation %s not finished yet (state: %s)", operation_id, state)
             return
-        
-        operation = operations[0]
-        
-        # Validate operation state
-        if operation.state != 'finished':
-            self.log.debug(f"Operation {operation_id} not finished yet (state: {operation.state})")
+        if operation_id in self._in_flight:
+            self.log.debug("Report already being generated for operation %s", operation_id)
             return
         
-        # Check for duplicate (prevent double-generation)
-        if operation_id in self._active_reports:
-            self.log.debug(f"Report already being generated for operation {operation_id}")
-            return
-        
-        self._active_reports.add(operation_id)
-        start_time = asyncio.get_event_loop().time()
-        
         try:
-            # Log auto-generation start
-            self.log.info(f"🚀 Auto-generating report for operation: {operation.name} ({operation_id})")
+            operations = await self.data_svc.locate('operations', match=dict(id=operation_id))
             
-            # Fetch detection data from ELK (non-blocking, with fallback)
-            detection_data = None
-            if self.elk_fetcher:
-                try:
-                    detection_data = await self.elk_fetcher.get_detection_data(operation_id)
-                    self.log.info(f"Detection data fetched: {detection_data.get('summary', {})}")
-                except Exception as elk_error:
-                    self.log.warning(f"ELK fetch failed (non-fatal): {elk_error}")
-                    detection_data = {'available': False, 'reason': str(elk_error)[:100]}
-            
-            # Generate PDF asynchronously
-            pdf_path = await self.pdf_generator.generate(operation, detection_data)
-            
-            if not pdf_path:
-                self.log.warning(f"PDF generation returned None for operation {operation_id}")
+            if not operations:
+                self.log.warning("Operation %s not found in event handler", operation_id)
                 return
             
-            # Calculate performance metrics
-            end_time = asyncio.get_event_loop().time()
-            generation_time_ms = int((end_time - start_time) * 1000)
-            event_latency_ms = int((start_time - event_received_time) * 1000)
-            total_time_ms = int((end_time - event_received_time) * 1000)
-            
-            # 6x efficiency metrics
-            manual_process_ms = 50000  # 50s baseline
-            time_saved_ms = manual_process_ms - total_time_ms
-            speedup = manual_process_ms / total_time_ms if total_time_ms > 0 else 0
-            
-            # Log success with efficiency metrics
-            self.log.info(
-                f"✅ Auto-generated report: {pdf_path.name} "
-                f"({pdf_path.stat().st_size / 1024:.1f}KB, {generation_time_ms}ms)"
-            )
+            operation = operations[0]
             
-            self.log.info(
-                f"📊 EFFICIENCY METRICS: "
-                f"Event latency: {event_latency_ms}ms | "
-                f"Generation: {generation_time_ms}ms | "
-                f"Total: {total_time_ms}ms"
-            )
+            # Validate operation state
+            if operation.state != 'finished':
+                self.log.debug("Operation %s not finished yet (state: %s)", operation_id, operation.state)
+                return
             
-            # Check performance targets
-            if total_time_ms <= 8500:
-                self.log.info(
-                    f"⚡ Performance: WITHIN TARGET ({total_time_ms}ms < 8.5s) | "
-                    f"Speedup: {speedup:.1f}x faster | "
-                    f"Time saved: {time_saved_ms}ms"
-                )
-            else:
-                self.log.warning(
-                    f"⚠️ Performance: EXCEEDED TARGET ({total_time_ms}ms > 8.5s) | "
-                    f"Speedup: {speedup:.1f}x faster"
-                )
+            start_time = loop.time()
+            
+            # Claim the operation in one lookup; if an API request or earlier
+            # event is already generating it, that caller reports the result
+            generation, started = self._get_or_start_generation(operation_id, operation)
+            if not started:
+                self.log.debug("Report already being generated for operation %s", operation_id)
+                return
+            
+            # Log auto-generation start
+            self.log.debug("Auto-generating report for operation: %s (%s)", operation.name, operation_id)
+            
+            # Don't hold the event callback for the render: the generation runs
+            # as its own task (bounded by _render_slots, awaited by shutdown())
+            # and reports its outcome when done
+            generation.add_done_callback(
+                partial(self._on_event_generation_done, operation_id, event_received_time, start_time)
+            )
         
-        except asyncio.TimeoutError:
+        except Exception as e:
+            self.log.exception("Failed to auto-generate report for operation %s: %s", operation_id, e)
+    
+    def _on_event_generation_done(self, operation_id: str, event_received_time: float,
+                                  start_time: float, generation: asyncio.Task) -> None:
+        """Log the outcome of an event-triggered generation (task done callback)."""
+        if generation.cancelled():
+            self.log.warning("PDF auto-generation cancelled for operation %s", operation_id)
+            return
+        
+        error = generation.exception()
+        if isinstance(error, asyncio.TimeoutError):
             self.log.error(
-                f"PDF auto-generation timed out for operation {operation_id} "
-                f"after {self.config.generation_timeout}s"
+                "PDF auto-generation timed out for operation %s after %ss",
+                operation_id, self.config.generation_timeout
             )
+            return
+        if error is not None:
+            self.log.error(
+                "Failed to auto-generate report for operation %s: %s", operation_id, error,
+                exc_info=error
+            )
+            return
         
-        except Exception as e:
-            self.log.exception(f"Failed to auto-generate report for operation {operation_id}: {e}")
+        result = generation.result()
+        if not result:
+            self.log.warning("PDF generation returned None for operation %s", operation_id)
+            return
+        
+        pdf_path, report = result
         
-        finally:
-            # Always remove from active reports
-            self._active_reports.discard(operation_id)
+        # Calculate performance metrics (target: 8.5s from event to PDF)
+        end_time = asyncio.get_running_loop().time()
+        self._log_report_generated(
+            'event', operation_id, pdf_path, report,
+            generation_ms=int((end_time - start_time) * 1000),
+            total_ms=int((end_time - event_received_time) * 1000),
+            target_ms=8500,
+            latency_ms=int((start_time - event_received_time) * 1000)
+        )
     
     async def list_reports(self, request: web.Request) -> web.Response:
         """
@@ -415,27 +459,16 @@ class ReportService:
             }
         """
         try:
-            reports = []
-            report_dir = self.config.output_dir
-            
-            if not report_dir.exists():
-                return web.json_response({
-                    'success': True,
-                    'count': 0,
-                    'reports': []
-                })
-            
-            for pdf_file in report_dir.glob('*.pdf'):
-                stat = pdf_file.stat()
-                reports.append({
-                    'filename': pdf_file.name,
-                    'path': str(pdf_file),
-                    'size_kb': stat.st_size / 1024,
-                    'created': datetime.fromtimestamp(stat.st_mtime).isoformat()
-                })
-            
-            # Sort by creation time (newest first)
-            reports.sort(key=lambda r: r['created'], reverse=True)
+            index = await self._get_report_index()
+            
+            # Sort by creation time (newest first); listings are pre-rendered,
+            # and the sorted list is kept until the index changes
+            if self._report_listings is None:
+                self._report_listings = [
+                    entry['listing']
+                    for entry in sorted(index.values(), key=itemgetter('mtime'), reverse=True)
+                ]
+            reports = self._report_listings
             
             return web.json_response({
                 'success': True,
@@ -444,7 +477,7 @@ class ReportService:
             })
         
         except Exception as e:
-            self.log.exception(f"Failed to list reports: {e}")
+            self.log.exception("Failed to list reports: %s", e)
             return web.json_response(
                 {'success': False, 'error': str(e)},
                 status=500
@@ -455,36 +488,313 @@ class ReportService:
         Gracefully shutdown the report service.
         
         Thread Safety:
-            - Waits for active reports to complete (max 30s)
+            - Waits for active reports to complete (max 30s), then cancels the rest
             - Calls executor.shutdown(wait=True) to join worker threads
             - Prevents thread leaks
         """
         self.log.info("🔧 Shutting down report service...")
         
-        # Wait for active reports to complete (with timeout)
-        if self._active_reports:
-            self.log.info(f"Waiting for {len(self._active_reports)} active reports to complete...")
+        # Cleanup steps run LIFO on exit, each one even if a later-registered
+        # step raised, so a failing ELK close can't leak the executor
+        async with AsyncExitStack() as cleanup:
+            # ✅ CRITICAL: Close executor to prevent thread/process leaks
+            cleanup.push_async_callback(self._close_executor)
             
-            timeout = 30  # 30 seconds max wait
-            start_time = asyncio.get_event_loop().time()
+            # Close shared ELK client connections
+            if self.elk_fetcher:
+                cleanup.push_async_callback(ELKFetcher.shutdown_shared)
+                cleanup.push_async_callback(self.elk_fetcher.close)
             
-            while self._active_reports and (asyncio.get_event_loop().time() - start_time) < timeout:
-                await asyncio.sleep(0.5)
+            # Shutdown PDF generator (only if a report was ever generated)
+            if self.pdf_generator is not None:
+                cleanup.push_async_callback(self.pdf_generator.shutdown)
             
-            if self._active_reports:
-                self.log.warning(
-                    f"Timeout waiting for {len(self._active_reports)} reports: "
-                    f"{list(self._active_reports)}"
-                )
+            # Wait for active reports to complete (with timeout)
+            if self._in_flight:
+                self.log.info("Waiting for %s active reports to complete...", len(self._in_flight))
+                
+                # Wake as soon as the last generation finishes (30 seconds max wait)
+                _, pending = await asyncio.wait(list(self._in_flight.values()), timeout=30)
+                
+                if pending:
+                    pending_ids = [op_id for op_id, task in self._in_flight.items() if task in pending]
+                    self.log.warning(
+                        "Timeout waiting for %s reports, cancelling: %s", len(pending), pending_ids
+                    )
+                    # Renders not yet picked up by a worker are dropped; one
+                    # already running finishes when the executor is joined
+                    for task in pending:
+                        task.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
         
-        # Shutdown PDF generator
-        await self.pdf_generator.shutdown()
+        self.log.info("✅ Report service shutdown complete")
+    
+    async def _close_executor(self) -> None:
+        """Join and close the shared render executor."""
+        self.log.info("Closing %s...", type(self._executor).__name__)
+        # Joining worker threads/processes blocks; keep it off the event loop
+        await asyncio.to_thread(self._executor.shutdown, wait=True, cancel_futures=False)
+    
+    def _get_or_start_generation(self, operation_id: str, operation) -> Tuple[asyncio.Task, bool]:
+        """
+        Return the in-flight generation for an operation, starting it if needed.
         
-        # ✅ CRITICAL: Close ThreadPoolExecutor to prevent thread leaks
-        self.log.info("Closing ThreadPoolExecutor...")
-        self._executor.shutdown(wait=True)
+        Args:
+            operation_id: Operation ID (in-flight key)
+            operation: Finished Caldera operation
+            
+        Returns:
+            Tuple of (task resolving to _generate_once()'s result, started_here)
+        """
+        # No await between the lookup and the insert, so the claim is atomic
+        # on the event loop without a lock
+        task = self._in_flight.get(operation_id)
+        if task is not None:
+            return task, False
+        
+        task = asyncio.create_task(self._generate_once(operation_id, operation))
+        self._in_flight[operation_id] = task
+        task.add_done_callback(lambda _: self._in_flight.pop(operation_id, None))
+        return task, True
+    
+    async def _fetch_detection_data(self, operation_id: str,
+                                    max_techniques: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Fetch detection data from ELK (non-blocking, with fallback).
         
-        self.log.info("✅ Report service shutdown complete")
+        Args:
+            operation_id: Operation ID
+            max_techniques: Optional cap on technique buckets (chain length)
+            
+        Returns:
+            Detection data dict, or None when ELK correlation is disabled
+        """
+        if not self.elk_fetcher:
+            return None
+        try:
+            detection_data = await self.elk_fetcher.get_detection_data(
+                operation_id, max_techniques=max_techniques
+            )
+            self.log.info("Detection data fetched: %s", detection_data.get('summary', {}))
+            return detection_data
+        except Exception as elk_error:
+            self.log.warning("ELK fetch failed (non-fatal): %s", elk_error)
+            return {'available': False, 'reason': str(elk_error)[:100]}
+    
+    async def _generate_once(self, operation_id: str, operation) -> Optional[Tuple[Path, Dict[str, Any]]]:
+        """
+        Fetch detection data, render the PDF and index it.
+        
+        Args:
+            operation_id: Operation ID
+            operation: Finished Caldera operation
+            
+        Returns:
+            Tuple of (pdf_path, report index entry), or None if generation returned nothing
+        """
+        # Size the technique aggregation to the chain (the operation is known here)
+        detection_data = await self._fetch_detection_data(
+            operation_id, max_techniques=len(operation.chain or [])
+        )
+        
+        # Generate PDF asynchronously (runs in self._executor)
+        async with self._render_slots:
+            generator = await self._ensure_generator()
+            pdf_path = await generator.generate(operation, detection_data)
+        
+        if not pdf_path:
+            return None
+        
+        return pdf_path, await self._index_report(pdf_path, operation_id, getattr(operation, 'name', ''))
+    
+    def _log_report_generated(self, trigger: str, operation_id: str, pdf_path: Path,
+                              report: Dict[str, Any], generation_ms: int, total_ms: int,
+                              target_ms: int, latency_ms: Optional[int] = None) -> None:
+        """
+        Log one structured event per generated report.
+        
+        The fields are rendered as key=value pairs and also attached to the
+        record as ``record.report`` for structured (JSON) handlers. Missing the
+        performance target raises the event to WARNING.
+        
+        Args:
+            trigger: 'api' (manual request) or 'event' (operation completed)
+            operation_id: Operation ID
+            pdf_path: Generated PDF
+            report: Report index entry (size)
+            generation_ms: Render time (ELK fetch + PDF)
+            total_ms: Time measured against the target
+            target_ms: Performance target
+            latency_ms: Event delivery latency (event trigger only)
+        """
+        within_target = total_ms <= target_ms
+        level = logging.INFO if within_target else logging.WARNING
+        if not self.log.isEnabledFor(level):
+            return
+        
+        fields = {
+            'trigger': trigger,
+            'op_id': operation_id,
+            'file': pdf_path.name,
+            'size_kb': round(report['size'] / 1024, 1),
+            'gen_ms': generation_ms,
+            'total_ms': total_ms,
+            'within_target': within_target,
+        }
+        if latency_ms is not None:
+            fields['latency_ms'] = latency_ms
+            # Speedup vs. the ~50s manual export/convert workflow
+            fields['speedup'] = round(50000 / total_ms, 1) if total_ms > 0 else 0
+        
+        self.log.log(
+            level, 'report_generated %s', ' '.join(f'{key}={value}' for key, value in fields.items()),
+            extra={'report': fields}
+        )
+    
+    @staticmethod
+    def _report_entry(pdf_path: Path, stat: os.stat_result) -> Dict[str, Any]:
+        """
+        Build a report index entry.
+        
+        The /list representation is rendered once here (timestamp formatting
+        included) instead of on every list request.
+        """
+        return {
+            'path': pdf_path,
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'listing': {
+                'filename': pdf_path.name,
+                'path': str(pdf_path),
+                'size_kb': stat.st_size / 1024,
+                'created': datetime.fromtimestamp(stat.st_mtime).isoformat()
+            }
+        }
+    
+    def _report_dir_mtime_ns(self) -> int:
+        """Modification time of the output directory (0 if it is missing)."""
+        try:
+            return os.stat(self.config.output_dir).st_mtime_ns
+        except FileNotFoundError:
+            return 0
+    
+    def _scan_reports(self) -> Tuple[Dict[str, Dict[str, Any]], int]:
+        """
+        Stat every PDF in the output directory.
+        
+        Blocking file I/O; callers run it via asyncio.to_thread so /list and
+        downloads don't stall event dispatch (operation.completed handling).
+        
+        Returns:
+            Tuple of (index by filename, directory mtime taken before the scan)
+        """
+        index = {}
+        report_dir = self.config.output_dir
+        # Taken first, so a file landing mid-scan triggers another scan
+        dir_mtime_ns = self._report_dir_mtime_ns()
+        # The config creates output_dir when it is first read (in __init__);
+        # it may still have been removed since. scandir() entries carry the
+        # file type from the directory listing, so only PDFs are stat()ed
+        try:
+            with os.scandir(report_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.pdf') or not entry.is_file(follow_symlinks=False):
+                        continue
+                    try:
+                        stat = entry.stat(follow_symlinks=False)
+                    except FileNotFoundError:
+                        continue
+                    index[entry.name] = self._report_entry(report_dir / entry.name, stat)
+        except FileNotFoundError:
+            pass
+        return index, dir_mtime_ns
+    
+    @staticmethod
+    def _op_prefix(op_id: str) -> str:
+        """Key for the operation ID lookup (IDs are matched on their first 8 chars)."""
+        return op_id[:8]
+    
+    @staticmethod
+    def _op_name_key(op_name: str) -> str:
+        """Key for the operation name lookup, as normalized by download_report()."""
+        return op_name.replace(' ', '_').lower()
+    
+    @staticmethod
+    def _op_id_from_filename(filename: str) -> Optional[str]:
+        """Extract the operation ID from report_<op_id>_<YYYYmmdd>_<HHMMSS>.pdf."""
+        if not filename.startswith('report_') or not filename.endswith('.pdf'):
+            return None
+        parts = filename[len('report_'):-len('.pdf')].rsplit('_', 2)
+        return parts[0] if len(parts) == 3 and parts[0] else None
+    
+    @staticmethod
+    def _link_newest(lookup: Dict[str, Dict[str, Any]], key: str, entry: Dict[str, Any]) -> None:
+        """Point lookup[key] at entry unless a newer report is already there."""
+        current = lookup.get(key)
+        if current is None or entry['mtime'] >= current['mtime']:
+            lookup[key] = entry
+    
+    async def _refresh_report_index(self) -> None:
+        """Rebuild the report index from disk without blocking the event loop."""
+        index, self._report_index_mtime_ns = await asyncio.to_thread(self._scan_reports)
+        self._report_index = index
+        self._report_listings = None
+        
+        self._reports_by_op_prefix = {}
+        for name, entry in index.items():
+            op_id = self._op_id_from_filename(name)
+            if op_id:
+                self._link_newest(self._reports_by_op_prefix, self._op_prefix(op_id), entry)
+        
+        # Names aren't in the filename; keep what was learned at generation
+        # time for reports that still exist
+        self._reports_by_op_name = {
+            key: index[entry['path'].name]
+            for key, entry in self._reports_by_op_name.items()
+            if entry['path'].name in index
+        }
+    
+    async def _get_report_index(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the report index, rescanning the output directory on first use
+        and whenever its mtime has moved since the last scan (one stat instead
+        of one per report).
+        """
+        if (self._report_index_mtime_ns is None
+                or await asyncio.to_thread(self._report_dir_mtime_ns) != self._report_index_mtime_ns):
+            await self._refresh_report_index()
+        return self._report_index
+    
+    async def _index_report(self, pdf_path: Path, op_id: str, op_name: str = '') -> Dict[str, Any]:
+        """Add a freshly generated report to the index and return its entry."""
+        stat = await asyncio.to_thread(pdf_path.stat)
+        entry = self._report_entry(pdf_path, stat)
+        self._report_index[pdf_path.name] = entry
+        self._report_listings = None
+        self._link_newest(self._reports_by_op_prefix, self._op_prefix(op_id), entry)
+        if op_name:
+            self._link_newest(self._reports_by_op_name, self._op_name_key(op_name), entry)
+        return entry
+    
+    def _latest_report(self, op_id: str, op_name: str = '') -> Optional[Dict[str, Any]]:
+        """
+        Find the newest indexed report for an operation.
+        
+        Reports are named report_<op_id>_<timestamp>.pdf and are looked up by
+        operation ID prefix, then by normalized operation name. Filenames that
+        don't follow that pattern fall back to a substring search.
+        """
+        report = self._reports_by_op_prefix.get(self._op_prefix(op_id))
+        if report is None and op_name:
+            report = self._reports_by_op_name.get(op_name)
+        if report is not None:
+            return report
+        
+        short_id = self._op_prefix(op_id)
+        matching = [entry for name, entry in self._report_index.items() if short_id in name]
+        if not matching and op_name:
+            matching = [entry for name, entry in self._report_index.items() if op_name in name.lower()]
+        return max(matching, key=itemgetter('mtime'), default=None)
     
     def get_logger(self):
         """Return the service logger."""
@@ -500,7 +810,7 @@ class ReportService:
             request: aiohttp request with op_id in path
         
         Response:
-            Success: PDF bytes with Content-Type: application/pdf
+            Success: PDF file (streamed) with Content-Type: application/pdf
             Error: JSON with error message (HTTP 404 if not found, 403 if operation not finished)
         """
         try:
@@ -517,7 +827,7 @@ class ReportService:
                 operations = await self.data_svc.locate('operations', match=dict(id=op_id))
                 
                 if not operations:
-                    self.log.warning(f"Operation {op_id} not found for download")
+                    self.log.warning("Operation %s not found for download", op_id)
                     return web.json_response(
                         {'success': False, 'error': f'Operation {op_id} not found'},
                         status=404
@@ -528,7 +838,7 @@ class ReportService:
                 # Enforce post-operation only downloads
                 if operation.state != 'finished':
                     self.log.warning(
-                        f"Download blocked: Operation {op_id} not finished (state: {operation.state})"
+                        "Download blocked: Operation %s not finished (state: %s)", op_id, operation.state
                     )
                     return web.json_response(
                         {
@@ -538,57 +848,42 @@ class ReportService:
                         status=403
                     )
             
-            # Find report file matching operation ID
-            report_dir = self.config.output_dir
+            # Find the newest indexed report for the operation ID (or name)
+            op_name = ''
+            if self.data_svc:
+                op_name = self._op_name_key(getattr(operation, 'name', ''))
             
-            if not report_dir.exists():
-                return web.json_response(
-                    {'success': False, 'error': 'No reports directory'},
-                    status=404
-                )
+            await self._get_report_index()
+            report = self._latest_report(op_id, op_name)
+            if report is None or not await asyncio.to_thread(report['path'].is_file):
+                # Written outside this service, or deleted since indexed: rescan
+                await self._refresh_report_index()
+                report = self._latest_report(op_id, op_name)
             
-            # Search for PDF containing operation ID or name
-            matching_files = []
-            for pdf_file in report_dir.glob('*.pdf'):
-                # Check if op_id is in filename (reports are named like operation_name_timestamp.pdf)
-                if op_id[:8] in pdf_file.name or op_id in pdf_file.name:
-                    matching_files.append(pdf_file)
-            
-            # Also check by looking up operation name
-            if not matching_files and self.data_svc:
-                op_name = getattr(operation, 'name', '').replace(' ', '_').lower()
-                for pdf_file in report_dir.glob('*.pdf'):
-                    if op_name and op_name in pdf_file.name.lower():
-                        matching_files.append(pdf_file)
-            
-            if not matching_files:
-                self.log.warning(f"No report found for operation {op_id}")
+            if report is None:
+                self.log.warning("No report found for operation %s", op_id)
                 return web.json_response(
                     {'success': False, 'error': f'No report found for operation {op_id}'},
                     status=404
                 )
             
-            # Return most recent matching file
-            matching_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-            pdf_path = matching_files[0]
-            
-            self.log.info(f"Serving report download: {pdf_path.name}")
+            pdf_path = report['path']
             
-            # Read and return PDF bytes
-            with open(pdf_path, 'rb') as f:
-                pdf_bytes = f.read()
+            self.log.info("Serving report download: %s", pdf_path.name)
             
-            return web.Response(
-                body=pdf_bytes,
-                content_type='application/pdf',
+            # Stream the file (sendfile where available) instead of reading it
+            # into memory on the event loop; aiohttp sets Content-Length
+            return web.FileResponse(
+                path=pdf_path,
+                chunk_size=64 * 1024,
                 headers={
-                    'Content-Disposition': f'attachment; filename="{pdf_path.name}"',
-                    'Content-Length': str(len(pdf_bytes))
+                    'Content-Type': 'application/pdf',
+                    'Content-Disposition': f'attachment; filename="{pdf_path.name}"'
                 }
             )
         
         except Exception as e:
-            self.log.exception(f"Failed to download report for {op_id}: {e}")
+            self.log.exception("Failed to download report for %s: %s", op_id, e)
             return web.json_response(
                 {'success': False, 'error': str(e)},
                 status=500
@@ -2,7 +2,7 @@
 Caldera plugin registration hook for PDF reporting.
 
 Dependency Safety:
-- Gracefully handles missing dependencies (reportlab, pillow, psutil)
+- Gracefully handles missing dependencies (aiohttp, reportlab, pillow, psutil)
 - If import fails → plugin disabled, Caldera server continues running
 - Logs clear error message with installation instructions
 
@@ -19,12 +19,15 @@ description = 'Automated PDF report generation for purple team operations'
 address = '/plugin/reporting/gui'
 access = None
 
+logger = logging.getLogger('reporting')
+
 # Global flag: plugin enabled status
 _plugin_enabled = False
 _import_error_message = None
 
 # ✅ DEPENDENCY SAFETY: Try imports, disable plugin if missing
 try:
+    from aiohttp import web
     from plugins.reporting.app.report_svc import ReportService
     _plugin_enabled = True
 except ImportError as e:
@@ -51,8 +54,6 @@ async def enable(services):
     Returns:
         None (modifies services dict in-place)
     """
-    logger = logging.getLogger('reporting')
-    
     # Check if plugin dependencies available
     if not _plugin_enabled:
         logger.error(
@@ -73,28 +74,18 @@ async def enable(services):
         # Create service instance (initializes ThreadPoolExecutor)
         report_svc = ReportService(services)
         
-        # Register REST API routes
-        app.router.add_route(
-            'POST',
-            '/plugin/reporting/generate',
-            report_svc.generate_report_api
-        )
-        logger.info('✅ Reporting plugin: REST API registered at POST /plugin/reporting/generate')
-        
-        app.router.add_route(
-            'GET',
-            '/plugin/reporting/list',
-            report_svc.list_reports
+        # Register REST API routes (once, in a single batch; this hook is the
+        # plugin's only entrypoint)
+        app.router.add_routes([
+            web.post('/plugin/reporting/generate', report_svc.generate_report_api),
+            web.get('/plugin/reporting/list', report_svc.list_reports, allow_head=False),
+            # Download endpoint for PDF retrieval
+            web.get('/plugin/reporting/download/{op_id}', report_svc.download_report, allow_head=False),
+        ])
+        logger.info(
+            '✅ Reporting plugin: REST API registered at POST /plugin/reporting/generate, '
+            'GET /plugin/reporting/list, GET /plugin/reporting/download/{op_id}'
         )
-        logger.info('✅ Reporting plugin: REST API registered at GET /plugin/reporting/list')
-        
-        # Download endpoint for PDF retrieval
-        app.router.add_route(
-            'GET',
-            '/plugin/reporting/download/{op_id}',
-            report_svc.download_report
-        )
-        logger.info('✅ Reporting plugin: REST API registered at GET /plugin/reporting/download/{op_id}')
         
         # Subscribe to operation completion events
         if event_svc:
@@ -126,8 +117,6 @@ async def disable(services):
         - Waits for pending reports (max 30s)
         - Prevents thread leaks
     """
-    logger = logging.getLogger('reporting')
-    
     if not _plugin_enabled:
         logger.debug('Reporting plugin was not enabled, skipping disable')
         return
@@ -3,14 +3,52 @@ Test fixtures for reporting plugin tests.
 
 Provides mock Caldera objects (operations, agents, abilities, links)
 for comprehensive unit testing without requiring a full Caldera instance.
+
+Operations are SimpleNamespaces and abilities, links and agents slotted
+dataclasses rather than MagicMocks: the generator reads them once per link,
+and MagicMock builds child mocks lazily on every attribute access.
 """
 
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, AsyncMock
 from pathlib import Path
+from types import SimpleNamespace
 import pytest
 
 
+@dataclass(slots=True, frozen=True)
+class AbilityStub:
+    """Stand-in for a Caldera ability (frozen, so hashable like a dict key)."""
+    ability_id: str
+    name: str
+    description: str
+    tactic: str
+    technique_id: str
+    technique_name: str
+
+
+@dataclass(slots=True)
+class LinkStub:
+    """Stand-in for a Caldera link (one executed ability)."""
+    ability: AbilityStub
+    status: int
+    finish: str
+    command: str
+    output: str
+
+
+@dataclass(slots=True)
+class AgentStub:
+    """Stand-in for a Caldera agent."""
+    paw: str
+    platform: str
+    host: str
+    username: str
+    privilege: str
+    last_seen: str
+
+
 @pytest.fixture
 def mock_config():
     """Mock ReportingConfig object."""
@@ -20,6 +58,8 @@ def mock_config():
     config.font_name = 'Helvetica'
     config.font_size = 10
     config.max_workers = 3
+    config.use_processes = False
+    config.pdf_compress = True
     config.generation_timeout = 30
     config.max_memory_mb = 100
     config.company_name = 'Triskele Labs'
@@ -36,102 +76,102 @@ def mock_config():
 @pytest.fixture
 def mock_ability_t1078():
     """Mock ability for T1078 (Valid Accounts)."""
-    ability = MagicMock()
-    ability.ability_id = 'abc-123'
-    ability.name = 'Valid Accounts'
-    ability.description = 'Use valid credentials to authenticate'
-    ability.tactic = 'persistence'
-    ability.technique_id = 'T1078'
-    ability.technique_name = 'Valid Accounts'
-    return ability
+    return AbilityStub(
+        ability_id='abc-123',
+        name='Valid Accounts',
+        description='Use valid credentials to authenticate',
+        tactic='persistence',
+        technique_id='T1078',
+        technique_name='Valid Accounts'
+    )
 
 
 @pytest.fixture
 def mock_ability_t1059():
     """Mock ability for T1059.001 (PowerShell)."""
-    ability = MagicMock()
-    ability.ability_id = 'def-456'
-    ability.name = 'PowerShell Execution'
-    ability.description = 'Execute commands via PowerShell'
-    ability.tactic = 'execution'
-    ability.technique_id = 'T1059.001'
-    ability.technique_name = 'Command and Scripting Interpreter: PowerShell'
-    return ability
+    return AbilityStub(
+        ability_id='def-456',
+        name='PowerShell Execution',
+        description='Execute commands via PowerShell',
+        tactic='execution',
+        technique_id='T1059.001',
+        technique_name='Command and Scripting Interpreter: PowerShell'
+    )
 
 
 @pytest.fixture
 def mock_ability_t1018():
     """Mock ability for T1018 (Remote System Discovery)."""
-    ability = MagicMock()
-    ability.ability_id = 'ghi-789'
-    ability.name = 'Network Discovery'
-    ability.description = 'Discover remote systems'
-    ability.tactic = 'discovery'
-    ability.technique_id = 'T1018'
-    ability.technique_name = 'Remote System Discovery'
-    return ability
+    return AbilityStub(
+        ability_id='ghi-789',
+        name='Network Discovery',
+        description='Discover remote systems',
+        tactic='discovery',
+        technique_id='T1018',
+        technique_name='Remote System Discovery'
+    )
 
 
 @pytest.fixture
 def mock_link_success(mock_ability_t1078):
     """Mock successful link (executed technique)."""
-    link = MagicMock()
-    link.ability = mock_ability_t1078
-    link.status = 0  # Success
-    link.finish = datetime.now().isoformat()
-    link.command = 'net user /domain'
-    link.output = 'User accounts for \\\\DOMAIN\n\nAdministrator...'
-    return link
+    return LinkStub(
+        ability=mock_ability_t1078,
+        status=0,  # Success
+        finish=datetime.now().isoformat(),
+        command='net user /domain',
+        output='User accounts for \\\\DOMAIN\n\nAdministrator...'
+    )
 
 
 @pytest.fixture
 def mock_link_failed(mock_ability_t1059):
     """Mock failed link."""
-    link = MagicMock()
-    link.ability = mock_ability_t1059
-    link.status = 1  # Failed
-    link.finish = datetime.now().isoformat()
-    link.command = 'powershell.exe -Command "Get-Process"'
-    link.output = 'Access Denied'
-    return link
+    return LinkStub(
+        ability=mock_ability_t1059,
+        status=1,  # Failed
+        finish=datetime.now().isoformat(),
+        command='powershell.exe -Command "Get-Process"',
+        output='Access Denied'
+    )
 
 
 @pytest.fixture
 def mock_link_timeout(mock_ability_t1018):
     """Mock timed-out link."""
-    link = MagicMock()
-    link.ability = mock_ability_t1018
-    link.status = -2  # Timeout
-    link.finish = datetime.now().isoformat()
-    link.command = 'ping -n 1000 192.168.1.1'
-    link.output = ''
-    return link
+    return LinkStub(
+        ability=mock_ability_t1018,
+        status=-2,  # Timeout
+        finish=datetime.now().isoformat(),
+        command='ping -n 1000 192.168.1.1',
+        output=''
+    )
 
 
 @pytest.fixture
 def mock_agent():
     """Mock Caldera agent."""
-    agent = MagicMock()
-    agent.paw = 'agent-001'
-    agent.platform = 'windows'
-    agent.host = 'WORKSTATION-01'
-    agent.username = 'testuser'
-    agent.privilege = 'User'
-    agent.last_seen = datetime.now().isoformat()
-    return agent
+    return AgentStub(
+        paw='agent-001',
+        platform='windows',
+        host='WORKSTATION-01',
+        username='testuser',
+        privilege='User',
+        last_seen=datetime.now().isoformat()
+    )
 
 
 @pytest.fixture
 def mock_operation_simple(mock_agent, mock_link_success):
     """Mock simple operation with 1 successful technique."""
-    operation = MagicMock()
+    operation = SimpleNamespace()
     operation.id = 'op-simple-001'
     operation.name = 'Test Operation - Simple'
     operation.group = 'client_demo'
-    operation.adversary = MagicMock(name='Demo Adversary', description='Test adversary')
+    operation.adversary = SimpleNamespace(name='Demo Adversary', description='Test adversary')
     operation.jitter = '2/8'
-    operation.source = MagicMock(name='basic')
-    operation.planner = MagicMock(name='atomic')
+    operation.source = SimpleNamespace(name='basic')
+    operation.planner = SimpleNamespace(name='atomic')
     operation.state = 'finished'
     operation.start = datetime.now() - timedelta(minutes=5)
     operation.finish = datetime.now()
@@ -151,49 +191,53 @@ def mock_operation_complex(
     mock_ability_t1018
 ):
     """Mock complex operation with 30 techniques (mixed success/failure)."""
-    operation = MagicMock()
+    operation = SimpleNamespace()
     operation.id = 'op-complex-001'
     operation.name = 'Purple Team Exercise - Q1 2025'
     operation.group = 'acme_corp'
-    operation.adversary = MagicMock(
+    operation.adversary = SimpleNamespace(
         name='APT Simulation',
         description='Advanced persistent threat simulation'
     )
     operation.jitter = '4/8'
-    operation.source = MagicMock(name='adversary_profile')
-    operation.planner = MagicMock(name='batch')
+    operation.source = SimpleNamespace(name='adversary_profile')
+    operation.planner = SimpleNamespace(name='batch')
     operation.state = 'finished'
     operation.start = datetime.now() - timedelta(hours=2)
     operation.finish = datetime.now()
     
     # Create 30 links (20 success, 8 failed, 2 timeout)
-    links = []
-    for i in range(20):
-        link = MagicMock()
-        link.ability = mock_ability_t1078
-        link.status = 0
-        link.finish = (datetime.now() - timedelta(minutes=120-i*4)).isoformat()
-        link.command = f'test_command_{i}'
-        link.output = f'Output {i}'
-        links.append(link)
-    
-    for i in range(8):
-        link = MagicMock()
-        link.ability = mock_ability_t1059
-        link.status = 1
-        link.finish = (datetime.now() - timedelta(minutes=80-i*4)).isoformat()
-        link.command = f'failed_command_{i}'
-        link.output = 'Access Denied'
-        links.append(link)
-    
-    for i in range(2):
-        link = MagicMock()
-        link.ability = mock_ability_t1018
-        link.status = -2
-        link.finish = (datetime.now() - timedelta(minutes=40-i*4)).isoformat()
-        link.command = f'timeout_command_{i}'
-        link.output = ''
-        links.append(link)
+    now = datetime.now()
+    links = [
+        LinkStub(
+            ability=mock_ability_t1078,
+            status=0,
+            finish=(now - timedelta(minutes=120-i*4)).isoformat(),
+            command=f'test_command_{i}',
+            output=f'Output {i}'
+        )
+        for i in range(20)
+    ]
+    links += [
+        LinkStub(
+            ability=mock_ability_t1059,
+            status=1,
+            finish=(now - timedelta(minutes=80-i*4)).isoformat(),
+            command=f'failed_command_{i}',
+            output='Access Denied'
+        )
+        for i in range(8)
+    ]
+    links += [
+        LinkStub(
+            ability=mock_ability_t1018,
+            status=-2,
+            finish=(now - timedelta(minutes=40-i*4)).isoformat(),
+            command=f'timeout_command_{i}',
+            output=''
+        )
+        for i in range(2)
+    ]
     
     operation.chain = links
     operation.agents = [mock_agent]
@@ -204,11 +248,14 @@ def mock_operation_complex(
 @pytest.fixture
 def mock_operation_empty():
     """Mock operation with no techniques executed."""
-    operation = MagicMock()
+    operation = SimpleNamespace()
     operation.id = 'op-empty-001'
     operation.name = 'Empty Operation'
     operation.group = 'test'
-    operation.adversary = MagicMock(name='Test', description='Test')
+    operation.adversary = SimpleNamespace(name='Test', description='Test')
+    operation.jitter = '2/8'
+    operation.source = SimpleNamespace(name='basic')
+    operation.planner = SimpleNamespace(name='atomic')
     operation.state = 'finished'
     operation.start = datetime.now()
     operation.finish = datetime.now()
@@ -220,7 +267,7 @@ def mock_operation_empty():
 @pytest.fixture
 def mock_operation_running():
     """Mock operation that is still running (not finished)."""
-    operation = MagicMock()
+    operation = SimpleNamespace()
     operation.id = 'op-running-001'
     operation.name = 'Running Operation'
     operation.state = 'running'
@@ -228,3 +275,26 @@ def mock_operation_running():
     operation.finish = None
     operation.chain = []
     return operation
+
+
+@pytest.fixture
+def mock_elk_client():
+    """Mock AsyncElasticsearch client returning one detected and one evaded technique."""
+    client = AsyncMock()
+    client.search = AsyncMock(return_value={
+        'hits': {'total': {'value': 4}},
+        'aggregations': {
+            'by_technique': {'buckets': [
+                {'key': 'T1078', 'doc_count': 3,
+                 'detection_status': {'buckets': [{'key': 'detected'}]}},
+                {'key': 'T1059.001', 'doc_count': 1,
+                 'detection_status': {'buckets': [{'key': 'evaded'}]}}
+            ]},
+            'by_status': {'buckets': [
+                {'key': 'detected', 'doc_count': 3},
+                {'key': 'evaded', 'doc_count': 1}
+            ]}
+        }
+    })
+    client.close = AsyncMock()
+    return client
@@ -0,0 +1,134 @@
+"""
+Unit tests for ELK detection fetcher.
+
+Tests cover the shared client registry and the per-operation
+detection cache: hits, expiry, failures and least-recently-used eviction.
+"""
+
+from unittest.mock import MagicMock, patch
+import pytest
+
+from plugins.reporting.app.elk_fetcher import ELKFetcher, _get_shared_client
+from plugins.reporting.tests.fixtures import (
+    mock_config,
+    mock_elk_client
+)
+
+
+def _make_fetcher(config, client) -> ELKFetcher:
+    """ELKFetcher wired to a mock client instead of the shared one."""
+    with patch('plugins.reporting.app.elk_fetcher._get_shared_client', return_value=client):
+        return ELKFetcher(config)
+
+
+class TestELKFetcherSharedClient:
+    """Test the shared AsyncElasticsearch client registry."""
+    
+    def test_clients_shared_only_for_identical_settings(self):
+        """Test a fetcher with different TLS/timeout settings gets its own client."""
+        base = {'hosts': ['https://elk:9200'], 'api_key': 'key', 'verify_certs': True, 'request_timeout': 30}
+        
+        with patch('plugins.reporting.app.elk_fetcher.AsyncElasticsearch', side_effect=lambda **kw: MagicMock()), \
+                patch.dict('plugins.reporting.app.elk_fetcher._SHARED_CLIENTS', clear=True):
+            client = _get_shared_client(dict(base))
+            
+            assert _get_shared_client(dict(reversed(base.items()))) is client
+            assert _get_shared_client({**base, 'verify_certs': False}) is not client
+            assert _get_shared_client({**base, 'ca_certs': '/etc/ssl/elk.pem'}) is not client
+            assert _get_shared_client({**base, 'request_timeout': 60}) is not client
+            assert _get_shared_client({**base, 'api_key': 'other'}) is not client
+
+
+@pytest.mark.asyncio
+class TestELKFetcherCache:
+    """Test detection result caching."""
+    
+    async def test_cache_hit_skips_query(self, mock_config, mock_elk_client):
+        """Test a repeated fetch is served from the cache."""
+        fetcher = _make_fetcher(mock_config, mock_elk_client)
+        
+        first = await fetcher.get_detection_data('op-001')
+        second = await fetcher.get_detection_data('op-001')
+        
+        assert mock_elk_client.search.await_count == 1
+        assert second == first
+        assert second['techniques']['T1078'] == {'status': 'detected', 'count': 3}
+    
+    async def test_cache_returns_copies(self, mock_config, mock_elk_client):
+        """Test callers can't modify the cached result."""
+        fetcher = _make_fetcher(mock_config, mock_elk_client)
+        
+        first = await fetcher.get_detection_data('op-001')
+        first['techniques'].clear()
+        first['summary']['detected'] = 0
+        
+        second = await fetcher.get_detection_data('op-001')
+        
+        assert 'T1078' in second['techniques']
+        assert second['summary']['detected'] == 3
+    
+    async def test_cache_keyed_by_bucket_size(self, mock_config, mock_elk_client):
+        """Test a capped result isn't served to a caller asking for more techniques."""
+        fetcher = _make_fetcher(mock_config, mock_elk_client)
+        
+        await fetcher.get_detection_data('op-001', max_techniques=1)
+        await fetcher.get_detection_data('op-001')
+        await fetcher.get_detection_data('op-001', max_techniques=1)
+        
+        bucket_sizes = [
+            call.kwargs['aggs']['by_technique']['terms']['size']
+            for call in mock_elk_client.search.await_args_list
+        ]
+        assert bucket_sizes == [1, fetcher.MAX_TECHNIQUE_BUCKETS]
+    
+    async def test_cache_entry_expires_after_ttl(self, mock_config, mock_elk_client):
+        """Test an entry older than CACHE_TTL_SECONDS is queried again."""
+        fetcher = _make_fetcher(mock_config, mock_elk_client)
+        
+        await fetcher.get_detection_data('op-001')
+        
+        # Age the cached entry past the TTL
+        key = next(iter(fetcher._detection_cache))
+        stored_at, data = fetcher._detection_cache[key]
+        fetcher._detection_cache[key] = (stored_at - fetcher.CACHE_TTL_SECONDS - 1, data)
+        
+        await fetcher.get_detection_data('op-001')
+        
+        assert mock_elk_client.search.await_count == 2
+    
+    async def test_failed_query_not_cached(self, mock_config, mock_elk_client):
+        """Test an ELK failure is retried on the next fetch instead of cached."""
+        fetcher = _make_fetcher(mock_config, mock_elk_client)
+        response = mock_elk_client.search.return_value
+        mock_elk_client.search.side_effect = [RuntimeError('ELK down'), response]
+        
+        failed = await fetcher.get_detection_data('op-001')
+        recovered = await fetcher.get_detection_data('op-001')
+        
+        assert failed['available'] is False
+        assert recovered['available'] is True
+        assert mock_elk_client.search.await_count == 2
+    
+    async def test_cache_evicts_least_recently_used(self, mock_config, mock_elk_client):
+        """Test filling past CACHE_MAX_ENTRIES evicts the least recently used entry."""
+        fetcher = _make_fetcher(mock_config, mock_elk_client)
+        max_entries = fetcher.CACHE_MAX_ENTRIES
+        
+        for i in range(max_entries):
+            await fetcher.get_detection_data(f'op-{i:04d}')
+        
+        # A hit makes op-0000 most recently used, so op-0001 is now the oldest
+        await fetcher.get_detection_data('op-0000')
+        assert mock_elk_client.search.await_count == max_entries
+        
+        await fetcher.get_detection_data('op-new')
+        
+        cached_ops = {op_id for op_id, _ in fetcher._detection_cache}
+        assert len(fetcher._detection_cache) == max_entries
+        assert 'op-0000' in cached_ops
+        assert 'op-0001' not in cached_ops
+        assert 'op-new' in cached_ops
+        
+        # The evicted operation is queried again
+        await fetcher.get_detection_data('op-0001')
+        assert mock_elk_client.search.await_count == max_entries + 2
@@ -6,7 +6,9 @@ memory safety, timeout protection, and error handling.
 """
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch, AsyncMock
 import pytest
 
@@ -44,6 +46,24 @@ class TestPDFGeneratorInitialization:
         
         subtitle_style = generator.styles['TLSubtitle']
         assert subtitle_style.fontSize == 14
+    
+    def test_styles_shared_between_generators(self, mock_config):
+        """Test that generators with the same branding reuse one stylesheet."""
+        first = PDFGenerator(mock_config)
+        second = PDFGenerator(mock_config)
+        
+        assert first.styles is second.styles
+        assert second.styles['TLTitle'].fontSize == 24
+    
+    def test_heap_frozen_once_per_process(self, mock_config):
+        """Test gc.collect/gc.freeze run for the first generator only."""
+        with patch('plugins.reporting.app.pdf_generator._HEAP_FROZEN', False), \
+                patch('plugins.reporting.app.pdf_generator.gc') as mock_gc:
+            PDFGenerator(mock_config)
+            PDFGenerator(mock_config)
+        
+        mock_gc.collect.assert_called_once()
+        mock_gc.freeze.assert_called_once()
 
 
 class TestPDFGeneratorHeaderBuilding:
@@ -64,14 +84,13 @@ class TestPDFGeneratorHeaderBuilding:
     @patch('plugins.reporting.app.pdf_generator.Image')
     def test_build_header_with_logo(self, mock_image, mock_config, mock_operation_simple):
         """Test header building when logo exists."""
-        mock_config.logo_path = Path('plugins/reporting/static/assets/triskele_logo.png')
+        # The bundled logo; read once when the generator is created
+        mock_config.logo_path = Path(__file__).parents[1] / 'static' / 'assets' / 'triskele_logo.png'
         
-        # Mock Path.exists() to return True
-        with patch.object(Path, 'exists', return_value=True):
-            generator = PDFGenerator(mock_config)
-            elements = generator._build_header(mock_operation_simple)
-            
-            assert len(elements) >= 3  # Logo, spacer, title
+        generator = PDFGenerator(mock_config)
+        elements = generator._build_header(mock_operation_simple)
+        
+        assert len(elements) >= 3  # Logo, spacer, title
 
 
 class TestPDFGeneratorMetadataTable:
@@ -237,6 +256,23 @@ class TestPDFGeneratorAsyncGeneration:
         assert pdf_path is not None
         assert pdf_path.exists()
     
+    @pytest.mark.asyncio
+    async def test_generate_many_returns_paths_in_order(self, mock_config, mock_operation_empty, tmp_path):
+        """Test batch generation of several operations."""
+        mock_config.output_dir = tmp_path
+        generator = PDFGenerator(mock_config)
+        operations = [
+            SimpleNamespace(**{**vars(mock_operation_empty), 'id': f'op-batch-00{i}'})
+            for i in range(5)
+        ]
+        
+        pdf_paths = await generator.generate_many(operations)
+        
+        assert len(pdf_paths) == 5
+        for operation, pdf_path in zip(operations, pdf_paths):
+            assert pdf_path.exists()
+            assert operation.id in pdf_path.name
+    
     @pytest.mark.asyncio
     async def test_generate_returns_none_for_running_operation(self, mock_config, mock_operation_running):
         """Test that generate returns None for non-finished operations."""
@@ -286,24 +322,45 @@ class TestPDFGeneratorMemoryManagement:
     
     @pytest.mark.asyncio
     async def test_shutdown_closes_executor(self, mock_config):
-        """Test that shutdown closes ThreadPoolExecutor."""
-        generator = PDFGenerator(mock_config)
+        """Test that shutdown closes the generator's own executor."""
+        executor = ThreadPoolExecutor(max_workers=1)
+        generator = PDFGenerator(mock_config, executor=executor)
         
         await generator.shutdown()
         
         # Executor should be shutdown
+        assert executor._shutdown
+    
+    @pytest.mark.asyncio
+    async def test_shared_executor_closed_by_shutdown_shared(self, mock_config):
+        """Test that generators without an executor share one pool until shutdown_shared()."""
+        generator = PDFGenerator(mock_config)
+        other = PDFGenerator(mock_config)
+        assert generator.executor is other.executor
+        
+        # Shared pool outlives a single generator
+        await generator.shutdown()
+        assert not generator.executor._shutdown
+        
+        await PDFGenerator.shutdown_shared()
         assert generator.executor._shutdown
     
     @patch('plugins.reporting.app.pdf_generator.gc.collect')
     def test_gc_called_after_pdf_generation(self, mock_gc, mock_config, mock_operation_simple, tmp_path):
-        """Test that garbage collection is called after PDF generation."""
+        """Test that garbage collection runs once every GC_INTERVAL_REPORTS reports."""
         mock_config.output_dir = tmp_path
         generator = PDFGenerator(mock_config)
+        generator.GC_INTERVAL_REPORTS = 2
+        
+        generator._generate_pdf_sync(mock_operation_simple, 'test1.pdf')
+        
+        # Not after every report
+        mock_gc.assert_not_called()
         
-        generator._generate_pdf_sync(mock_operation_simple, 'test.pdf')
+        generator._generate_pdf_sync(mock_operation_simple, 'test2.pdf')
         
-        # gc.collect() should be called
-        mock_gc.assert_called()
+        # gc.collect() should be called once the interval is reached
+        mock_gc.assert_called_once()
 
 
 class TestPDFGeneratorErrorHandling: